@@ -15,7 +15,8 @@ class ProgressTracker:
         Initialize progress tracker
 
         Args:
-            total_items: Total number of items to process
+            total_items: Total number of items to process, or None when it is not known
+                up front (only bump() progress is supported then)
             task_name: Name of the task being tracked
         """
         self.total_items = total_items
@@ -31,7 +32,8 @@ class ProgressTracker:
         self.start_time = datetime.now()
         print("\n" + "="*70)
         print(f"  {self.task_name.upper()}")
-        print(f"  Found {self.total_items} items to process")
+        if self.total_items is not None:
+            print(f"  Found {self.total_items} items to process")
         print("="*70)
 
     def start_item(self, item_name, item_num=None):
@@ -98,6 +100,31 @@ class ProgressTracker:
             self.failed += 1
             print(f"   ❌ Failed to process {item_name}")
 
+    def bump(self, successful=0, failed=0):
+        """
+        Record a batch of finished items at once and redraw the overall progress bar.
+        Cheaper than start_item/complete_item when there are many small items.
+
+        Args:
+            successful: Number of items in the batch that succeeded
+            failed: Number of items in the batch that failed
+        """
+        self.successful += successful
+        self.failed += failed
+        self.current_item += successful + failed
+
+        if self.total_items is None:
+            sys.stdout.write(f'\r   Overall: {self.current_item} items processed')
+            sys.stdout.flush()
+            return
+
+        self.print_progress_bar(
+            self.current_item, self.total_items,
+            prefix='   Overall:',
+            suffix=f'{self.current_item}/{self.total_items} items',
+            length=40
+        )
+
     def finish(self):
         """Display final summary"""
         print("\n" + "="*70)
@@ -1,6 +1,9 @@
 import os
+import threading
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Tuple, Iterator
+from concurrent.futures import ThreadPoolExecutor, Future
 import requests
 import datetime
 import json
@@ -15,26 +18,10 @@ load_dotenv()
 # Configure logging
 logger = setup_logging(__name__)
 
-class TranscriptSummarizer:
-    """A class to summarize transcripts using the Fireworks AI API"""
+class AzureOpenAIProvider:
+    """Chat completion backend for the Azure OpenAI API"""
     
-    def __init__(self, input_folder=None, output_folder=None):
-        self.base_path = str(Path.home() / "cgithub" / "mcp-moat")
-        
-        # Set default paths if not provided
-        if input_folder is None:
-            self.input_folder = os.path.join(self.base_path, "wisdomhatch-txt")
-        else:
-            self.input_folder = input_folder
-            
-        if output_folder is None:
-            self.output_folder = os.path.join(self.base_path, "wisdomhatch-blog")
-        else:
-            self.output_folder = output_folder
-            
-        logger.info(f"Input folder: {self.input_folder}")
-        logger.info(f"Output folder: {self.output_folder}")
-        
+    def __init__(self):
         # Azure OpenAI API configuration
         self.api_key = os.getenv('AZURE_OPENAI_API_KEY')
         self.api_endpoint = os.getenv('AZURE_OPENAI_ENDPOINT')
@@ -57,25 +44,119 @@ class TranscriptSummarizer:
             "Content-Type": "application/json"
         }
         
+        # Reuse one pooled keep-alive connection for every request
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
         # Rate limiting configuration
         self.request_delay = 2  # Delay between requests in seconds
         self.retry_delay = 60   # Delay when hitting rate limits
+    
+    def query_api(self, payload):
+        """Query the Azure OpenAI API"""
+        try:
+            response = self.session.post(
+                self.api_url,
+                json=payload,
+                timeout=120
+            )
+            
+            if response.status_code == 429:  # Rate limit exceeded
+                logger.warning("Rate limit exceeded. Waiting before retry...")
+                sleep(self.retry_delay)
+                raise Exception("Rate limit exceeded")
+            elif response.status_code == 401:  # Unauthorized
+                logger.error("API authentication failed. Check your API key.")
+                raise Exception("API authentication failed")
+            elif response.status_code == 400:  # Bad request
+                logger.error(f"Bad request: {response.text}")
+                raise Exception(f"Bad request: {response.text}")
+            elif response.status_code != 200:
+                logger.error(f"API request failed with status code: {response.status_code}, response: {response.text}")
+                raise Exception(f"API request failed with status code: {response.status_code}")
+                
+            # Parse the response
+            json_response = response.json()
+            return json_response
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request error: {e}")
+            raise
+        finally:
+            sleep(self.request_delay)  # Rate limiting delay
+    
+    def complete(self, prompt: str, max_tokens: int = 4000, temperature: float = 0) -> str:
+        """Send a single user prompt and return the text of the first choice"""
+        payload = {
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+        
+        response = self.query_api(payload)
+        
+        # Extract the response content
+        if "choices" in response and len(response["choices"]) > 0:
+            return response["choices"][0]["message"]["content"].strip()
+        raise Exception("Invalid response format from API")
+
+
+class TranscriptSummarizer:
+    """A class to summarize transcripts using a pluggable LLM provider (Azure OpenAI by default)"""
+    
+    def __init__(self, input_folder=None, output_folder=None, provider=None):
+        self.base_path = str(Path.home() / "cgithub" / "mcp-moat")
+        
+        # Set default paths if not provided
+        if input_folder is None:
+            self.input_folder = os.path.join(self.base_path, "wisdomhatch-txt")
+        else:
+            self.input_folder = input_folder
+            
+        if output_folder is None:
+            self.output_folder = os.path.join(self.base_path, "wisdomhatch-blog")
+        else:
+            self.output_folder = output_folder
+            
+        logger.info(f"Input folder: {self.input_folder}")
+        logger.info(f"Output folder: {self.output_folder}")
+        
+        # Any object with a complete(prompt, max_tokens, temperature) -> str method
+        self.provider = provider if provider is not None else AzureOpenAIProvider()
+        
+        # Retry configuration
+        self.retry_delay = 60   # Base delay between retries
         self.max_retries = 5    # Maximum number of retries per chunk
+        self.max_workers = 4    # Chunks summarized concurrently
+        self.max_queued = 32    # Chunks read into memory but not yet summarized, at most
+        self.queue_slots = threading.BoundedSemaphore(self.max_queued)
+        self.max_transcripts_ahead = 2  # Transcripts queued past the one being collected
+        
+        # Part numbers already written per base name, filled by get_transcript_files
+        self.done_parts: Dict[str, Set[int]] = {}
         
     def setup_folders(self):
         """Create output folder if it doesn't exist"""
         os.makedirs(self.output_folder, exist_ok=True)
         logger.info(f"Output folder ready at: {self.output_folder}")
     
-    def get_processed_files(self) -> Set[str]:
-        """Get set of base names of already processed files"""
-        processed = set()
+    def get_processed_files(self) -> Dict[str, Set[int]]:
+        """Get already processed base names, mapped to the part numbers written for each"""
+        processed = {}
         if os.path.exists(self.output_folder):
             for file in os.listdir(self.output_folder):
                 if file.endswith('.md'):
                     # Remove _partX.md from the end to get base name
-                    base_name = file.rsplit('_part', 1)[0]
-                    processed.add(base_name)
+                    base_name, *suffix = file.rsplit('_part', 1)
+                    parts = processed.setdefault(base_name, set())
+                    part_num = suffix[0][:-len('.md')] if suffix else ''
+                    if part_num.isdigit():
+                        parts.add(int(part_num))
         return processed
         
     def get_transcript_files(self) -> List[str]:
@@ -83,92 +164,77 @@ class TranscriptSummarizer:
         if not os.path.exists(self.input_folder):
             raise FileNotFoundError(f"Input folder not found: {self.input_folder}")
         
-        # Get already processed files
+        # Get already processed files, keeping the written parts for per-chunk skipping
         processed_files = self.get_processed_files()
+        self.done_parts = processed_files
         
-        # Filter out already processed files
+        # Filter out already processed files; a transcript with only some parts written
+        # is kept, and queue_transcript resumes it from the missing parts
         unprocessed_files = []
         for f in os.listdir(self.input_folder):
             if f.endswith('.txt'):
                 base_name = os.path.splitext(f)[0]
-                if base_name not in processed_files:
-                    unprocessed_files.append(os.path.join(self.input_folder, f))
+                file_path = os.path.join(self.input_folder, f)
+                if base_name not in processed_files or not self.is_fully_processed(file_path, processed_files[base_name]):
+                    unprocessed_files.append(file_path)
                 else:
                     logger.info(f"Skipping {base_name} - already processed")
         
         return unprocessed_files
     
-    def chunk_text(self, text: str, chunk_size: int = 10000, overlap: int = 100) -> List[str]:
-        """Split text into chunks with overlap from previous chunk for context continuity
+    def is_fully_processed(self, file_path: str, done_parts: Set[int]) -> bool:
+        """Check whether every chunk of a transcript already has its part file"""
+        # Output named like a part but without a part number can't be checked chunk by
+        # chunk, so it keeps counting as complete
+        if not done_parts:
+            return True
+        
+        # Chunks are cut by character offsets, so the text length decides the part count.
+        # A UTF-8 file never has more characters than bytes, and longer text never has
+        # fewer chunks, so when the parts for the file size are all there, so are the
+        # parts for the text itself and the file doesn't need to be read
+        size_bound = os.stat(file_path).st_size
+        if all(i in done_parts for i, _ in enumerate(self.iter_chunk_spans(size_bound), 1)):
+            return True
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            text_length = len(f.read())
+        return all(i in done_parts for i, _ in enumerate(self.iter_chunk_spans(text_length), 1))
+    
+    def iter_chunk_spans(self, text_length: int, chunk_size: int = 10000, overlap: int = 100) -> Iterator[Tuple[int, int]]:
+        """Yield the (start, end) offsets of each chunk, overlapping the previous chunk for context continuity
 
         Args:
-            text: Text to split into chunks
+            text_length: Length of the text to split
             chunk_size: Size of each chunk in characters
             overlap: Number of characters to overlap from the end of previous chunk
 
-        Returns:
-            List of text chunks with overlap
+        Yields:
+            (start, end) slice bounds of each chunk
         """
-        if len(text) <= chunk_size:
-            return [text]
+        if text_length <= chunk_size:
+            yield 0, text_length
+            return
 
-        chunks = []
         start = 0
 
-        while start < len(text):
+        while start < text_length:
             # For chunks after the first one, include overlap from previous chunk
             if start > 0:
                 start = max(0, start - overlap)
 
             end = start + chunk_size
-            chunk = text[start:end]
-            chunks.append(chunk)
+            yield start, end
 
             # Move start position for next chunk (accounting for overlap)
             start = end
 
             # Break if we've reached the end
-            if end >= len(text):
+            if end >= text_length:
                 break
-
-        return chunks
-    
-    def query_api(self, payload):
-        """Query the Azure OpenAI API"""
-        try:
-            response = requests.post(
-                self.api_url,
-                headers=self.headers,
-                json=payload,
-                timeout=120
-            )
-            
-            if response.status_code == 429:  # Rate limit exceeded
-                logger.warning("Rate limit exceeded. Waiting before retry...")
-                sleep(self.retry_delay)
-                raise Exception("Rate limit exceeded")
-            elif response.status_code == 401:  # Unauthorized
-                logger.error("API authentication failed. Check your API key.")
-                raise Exception("API authentication failed")
-            elif response.status_code == 400:  # Bad request
-                logger.error(f"Bad request: {response.text}")
-                raise Exception(f"Bad request: {response.text}")
-            elif response.status_code != 200:
-                logger.error(f"API request failed with status code: {response.status_code}, response: {response.text}")
-                raise Exception(f"API request failed with status code: {response.status_code}")
-                
-            # Parse the response
-            json_response = response.json()
-            return json_response
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request error: {e}")
-            raise
-        finally:
-            sleep(self.request_delay)  # Rate limiting delay
     
     def generate_summary(self, text: str) -> Dict[str, str]:
-        """Generate summary and key takeaways using the Azure OpenAI API"""
+        """Generate summary and key takeaways using the configured LLM provider"""
         # Prepare the text for summarization
         text_to_summarize = text[:10000]  # Using full chunk size of 10000 characters
         
@@ -188,49 +254,32 @@ Key Takeaways:
 - [Additional takeaways]
 """
         
-        payload = {
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "max_tokens": 4000,
-            "temperature": 0
-        }
-        
         retry_count = 0
         last_error = None
         
         while retry_count < self.max_retries:
             try:
                 # Make API request
-                response = self.query_api(payload)
+                full_response = self.provider.complete(prompt, max_tokens=4000, temperature=0)
                 
-                # Extract the response content
-                if "choices" in response and len(response["choices"]) > 0:
-                    full_response = response["choices"][0]["message"]["content"].strip()
+                # Extract summary and takeaways from response
+                parts = full_response.split("Summary:")
+                if len(parts) > 1:
+                    content = parts[1].strip()
+                    summary_parts = content.split("Key Takeaways:")
                     
-                    # Extract summary and takeaways from response
-                    parts = full_response.split("Summary:")
-                    if len(parts) > 1:
-                        content = parts[1].strip()
-                        summary_parts = content.split("Key Takeaways:")
-                        
-                        summary = summary_parts[0].strip()
-                        takeaways = summary_parts[1].strip() if len(summary_parts) > 1 else ""
-                        
-                        return {
-                            "summary": summary,
-                            "takeaways": takeaways
-                        }
-                    else:
-                        return {
-                            "summary": full_response.strip(),
-                            "takeaways": "No specific takeaways extracted."
-                        }
+                    summary = summary_parts[0].strip()
+                    takeaways = summary_parts[1].strip() if len(summary_parts) > 1 else ""
+                    
+                    return {
+                        "summary": summary,
+                        "takeaways": takeaways
+                    }
                 else:
-                    raise Exception("Invalid response format from API")
+                    return {
+                        "summary": full_response.strip(),
+                        "takeaways": "No specific takeaways extracted."
+                    }
                     
             except Exception as e:
                 last_error = str(e)
@@ -248,59 +297,115 @@ Key Takeaways:
                     continue
                 raise Exception(f"Max retries reached. Last error: {last_error}")
     
-    def process_transcript(self, file_path: str):
-        """Process a single transcript file"""
+    def write_summary(self, output_file: str, base_name: str, part_num: int, result: Dict[str, str], chunk: str):
+        """Write one summary part as a single buffer instead of many small writes"""
+        content = (
+            f"# Summary for: {base_name} - Part {part_num}\n\n"
+            f"**Generated on:** {datetime.datetime.now()}\n\n"
+            "---\n\n"
+            "## SUMMARY:\n\n"
+            f"{result['summary']}"
+            "\n\n## KEY TAKEAWAYS:\n\n"
+            f"{result['takeaways']}"
+            "\n\n## ORIGINAL TEXT:\n\n"
+            f"{chunk}"
+        )
+        Path(output_file).write_bytes(content.encode('utf-8'))
+    
+    def summarize_chunk(self, base_name: str, part_num: int, chunk: str):
+        """Summarize a single chunk and save it to its part file (runs on a worker thread)"""
+        output_file = os.path.join(
+            self.output_folder,
+            f"{base_name}_part{part_num}.md"
+        )
+        
+        # Generate summary
+        result = self.generate_summary(chunk)
+        
+        # Create output file with markdown formatting
+        self.write_summary(output_file, base_name, part_num, result, chunk)
+        
+        logger.info(f"Saved summary part {part_num} to: {output_file}")
+    
+    def submit_chunk(self, executor: ThreadPoolExecutor, base_name: str, part_num: int, chunk: str) -> Future:
+        """Queue one chunk on the worker pool, blocking while max_queued chunks are still pending"""
+        self.queue_slots.acquire()
         try:
-            base_name = os.path.splitext(os.path.basename(file_path))[0]
-            logger.info(f"Processing transcript: {base_name}")
-            
-            # Read the transcript
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Split into chunks
-            chunks = self.chunk_text(content)
-            logger.info(f"Split into {len(chunks)} chunks")
-            
-            # Process each chunk
-            for i, chunk in enumerate(chunks, 1):
-                try:
-                    # Check if this specific part exists
-                    output_file = os.path.join(
-                        self.output_folder,
-                        f"{base_name}_part{i}.md"
-                    )
-                    
-                    if os.path.exists(output_file):
-                        logger.info(f"Skipping {base_name} part {i} - already exists")
-                        continue
-                    
-                    # Generate summary
-                    result = self.generate_summary(chunk)
-                    
-                    # Create output file with markdown formatting
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        f.write(f"# Summary for: {base_name} - Part {i}\n\n")
-                        f.write(f"**Generated on:** {datetime.datetime.now()}\n\n")
-                        f.write("---\n\n")
-                        f.write("## SUMMARY:\n\n")
-                        f.write(result['summary'])
-                        f.write("\n\n## KEY TAKEAWAYS:\n\n")
-                        f.write(result['takeaways'])
-                        f.write("\n\n## ORIGINAL TEXT:\n\n")
-                        f.write(chunk)
-                    
-                    logger.info(f"Saved summary part {i} to: {output_file}")
-                    
-                except Exception as e:
-                    if "API quota exceeded" in str(e):
-                        raise
-                    logger.error(f"Error processing chunk {i} of {base_name}: {e}")
-                    continue
-                
-        except Exception as e:
-            logger.error(f"Error processing {file_path}: {e}")
+            future = executor.submit(self.summarize_chunk, base_name, part_num, chunk)
+        except Exception:
+            self.queue_slots.release()
             raise
+        # The slot frees up as soon as the chunk is done, whether or not its result was collected
+        future.add_done_callback(lambda _: self.queue_slots.release())
+        return future
+    
+    def queue_transcript(self, file_path: str, executor: ThreadPoolExecutor) -> List[Tuple[int, Future]]:
+        """
+        Read a transcript and queue its missing chunks on the worker pool
+        
+        Args:
+            file_path: Path to the transcript file
+            executor: Worker pool that summarizes and writes chunks
+        
+        Returns:
+            List of (part number, future) pairs for the queued chunks
+        """
+        base_name = os.path.splitext(os.path.basename(file_path))[0]
+        logger.info(f"Processing transcript: {base_name}")
+        
+        # Read the transcript
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        # Split into chunks lazily; parts already on disk are never sliced out
+        done_parts = self.done_parts.get(base_name, set())
+        
+        queued = []
+        num_chunks = 0
+        for num_chunks, (start, end) in enumerate(self.iter_chunk_spans(len(content)), 1):
+            # Check if this specific part exists
+            if num_chunks in done_parts:
+                logger.info(f"Skipping {base_name} part {num_chunks} - already exists")
+                continue
+            
+            queued.append((num_chunks, self.submit_chunk(executor, base_name, num_chunks, content[start:end])))
+        
+        logger.info(f"Split into {num_chunks} chunks")
+        return queued
+    
+    def wait_for_transcript(self, base_name: str, queued: List[Tuple[int, Future]]):
+        """Wait for the queued chunks of one transcript, logging chunks that failed"""
+        for i, future in queued:
+            try:
+                future.result()
+            except Exception as e:
+                if "API quota exceeded" in str(e):
+                    raise
+                logger.error(f"Error processing chunk {i} of {base_name}: {e}")
+    
+    def queue_in_order(self, transcript_files: List[str], executor: ThreadPoolExecutor) -> Iterator[Tuple[str, List[Tuple[int, Future]]]]:
+        """
+        Queue transcripts on the worker pool and yield them back in order, reading at most
+        max_transcripts_ahead transcripts past the one being collected
+        
+        Args:
+            transcript_files: Paths of the transcripts to process
+            executor: Worker pool that summarizes and writes chunks
+        
+        Yields:
+            (path, queued chunks) pairs; queued is None when the transcript couldn't be read
+        """
+        pending = deque()
+        for transcript_file in transcript_files:
+            try:
+                queued = self.queue_transcript(transcript_file, executor)
+            except Exception as e:
+                logger.error(f"Error processing {transcript_file}: {e}")
+                queued = None
+            pending.append((transcript_file, queued))
+            if len(pending) > self.max_transcripts_ahead:
+                yield pending.popleft()
+        yield from pending
     
     def process_all_transcripts(self):
         """Process all transcripts with progress tracking"""
@@ -322,24 +427,31 @@ Key Takeaways:
             )
             progress_tracker.start()
 
-            # Process each transcript
-            for transcript_file in transcript_files:
-                try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Transcripts are read a few ahead of the workers and collected in order right
+                # behind them, so progress times are real and a quota error stops the run
+                # before the remaining transcripts are read
+                for transcript_file, queued in self.queue_in_order(transcript_files, executor):
                     file_name = os.path.basename(transcript_file)
                     progress_tracker.start_item(file_name)
 
-                    self.process_transcript(transcript_file)
+                    if queued is None:
+                        progress_tracker.complete_item(file_name, success=False)
+                        continue
 
-                    progress_tracker.complete_item(file_name, success=True)
-                except Exception as e:
-                    file_name = os.path.basename(transcript_file)
-                    progress_tracker.complete_item(file_name, success=False)
+                    try:
+                        self.wait_for_transcript(os.path.splitext(file_name)[0], queued)
 
-                    if "API quota exceeded" in str(e):
-                        logger.error("API quota exceeded. Stopping all processing.")
-                        break
-                    logger.error(f"Failed to process {transcript_file}: {e}")
-                    continue
+                        progress_tracker.complete_item(file_name, success=True)
+                    except Exception as e:
+                        progress_tracker.complete_item(file_name, success=False)
+
+                        if "API quota exceeded" in str(e):
+                            logger.error("API quota exceeded. Stopping all processing.")
+                            executor.shutdown(cancel_futures=True)
+                            break
+                        logger.error(f"Failed to process {transcript_file}: {e}")
+                        continue
 
             # Show final summary
             progress_tracker.finish()
@@ -351,7 +463,7 @@ Key Takeaways:
 
 def parse_arguments():
     """Parse command line arguments"""
-    parser = argparse.ArgumentParser(description='Summarize transcripts using Fireworks AI API')
+    parser = argparse.ArgumentParser(description='Summarize transcripts using Azure OpenAI API')
     parser.add_argument('-i', '--input', dest='input_folder', 
                         help='Input folder containing transcript files')
     parser.add_argument('-o', '--output', dest='output_folder',
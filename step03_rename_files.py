@@ -4,6 +4,7 @@ import argparse
 import logging
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(
@@ -12,30 +13,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def natural_sort_key(s):
-    """Key function for natural sorting of strings with numbers"""
-    return [int(text) if text.isdigit() else text.lower()
-            for text in re.split('([0-9]+)', s)]
-
-def get_session_number(filename):
-    """Extract session number from filename"""
-    match = re.search(r'Live Session ([IVX]+)', filename)
-    if match:
-        session_num = match.group(1)
-        # Convert Roman numerals to integers
-        roman_values = {'I': 1, 'II': 2, 'III': 3, 'IV': 4, 'V': 5, 'VI': 6, 'VII': 7, 'VIII': 8, 'IX': 9, 'X': 10}
-        return roman_values.get(session_num, 0)
-    return 0
-
-def get_part_number(filename):
-    """Extract part number from filename"""
-    match = re.search(r'Part (\d+)', filename)
-    return int(match.group(1)) if match else 0
-
-def get_subpart_number(filename):
-    """Extract subpart number from filename"""
-    match = re.search(r'--part(\d+)', filename)
-    return int(match.group(1)) if match else 0
+# Splits a filename into its name without serial prefix, the main name and an optional _partN number in one pass
+_FILE_KEY_RE = re.compile(r'^(?:\d+-)?((.*?)(?:_part(\d+).*)?)$', re.DOTALL)
 
 def rename_files(input_folder=None):
     """Rename files with proper extensions and serial numbers"""
@@ -45,67 +24,108 @@ def rename_files(input_folder=None):
     else:
         blog_dir = Path(input_folder)
         
-    logger.info(f"Input folder: {blog_dir}")
+    logger.info("Input folder: %s", blog_dir)
     
     # Ensure the directory exists
     if not blog_dir.exists():
-        logger.error(f"Input directory does not exist: {blog_dir}")
+        logger.error("Input directory does not exist: %s", blog_dir)
         raise FileNotFoundError(f"Directory not found: {blog_dir}")
     
     # Get all text files (either .md or .txt)
-    files = [f for f in os.listdir(blog_dir) if f.endswith('.txt') or f.endswith('.md')]
+    with os.scandir(blog_dir) as it:
+        files = [(entry.name, entry.inode()) for entry in it if entry.name.endswith(('.txt', '.md')) and entry.is_file()]
     
-    # Extract base names and part numbers for sorting
+    # Extract base names and part numbers for sorting. Each entry is a plain tuple that
+    # starts with its own sort key, so the sort compares tuples in C instead of calling a
+    # Python key function per file; the scan index keeps ties in their original order
     file_info = []
-    for file in files:
-        # Remove any existing serial prefix
-        base_name = re.sub(r'^\d+-', '', file)
-        
-        # Extract base name without part number
-        part_match = re.search(r'_part(\d+)', base_name)
-        part_num = int(part_match.group(1)) if part_match else 0
-        main_name = base_name.split('_part')[0] if part_match else base_name
-        
-        file_info.append({
-            'file_name': file,
-            'main_name': main_name,
-            'part_num': part_num
-        })
+    for index, (file, inode) in enumerate(files):
+        # Extract base name (without serial prefix), main name (also without part suffix)
+        # and part number in a single match
+        base_name, main_name, part = _FILE_KEY_RE.match(file).groups()
+        file_info.append((main_name, int(part) if part else 0, index, file, base_name, inode))
     
     # Sort files by main name first, then by part number
-    file_info.sort(key=lambda x: (x['main_name'], x['part_num']))
-    
-    # Counter for serial numbering
-    serial_number = 1
+    file_info.sort()
     
-    # Process files in sorted order
-    for info in file_info:
-        old_name = info['file_name']
-        
+    # Build the complete rename plan before touching the filesystem
+    plan = []
+    for serial_number, (_, _, _, old_name, base_name, inode) in enumerate(file_info, 1):
         # Create the new name with serial number prefix
         serial_prefix = f"{serial_number:03d}-"  # Format as 001, 002, etc.
         
-        # Remove any existing serial prefix
-        base_name = re.sub(r'^\d+-', '', old_name)
-        
-        # Create the new name
+        # Create the new name from the name without its old serial prefix
         new_name = f"{serial_prefix}{base_name}"
         
         # Skip if the file already has the correct name
-        if old_name == new_name:
-            serial_number += 1
-            continue
-        
-        # Get the full paths
-        old_path = os.path.join(blog_dir, old_name)
-        new_path = os.path.join(blog_dir, new_name)
-        
+        if old_name != new_name:
+            plan.append((inode, old_name, new_name))
+    
+    # Serial numbers follow the name order above, but the renames themselves can run in
+    # inode order, which keeps inode-table access sequential on large directories
+    plan.sort()
+    apply_rename_plan(blog_dir, [(old_name, new_name) for _, old_name, new_name in plan])
+
+def _replace_all(blog_dir, pairs):
+    """Rename each (old_name, new_name) pair in blog_dir, returning the pairs that succeeded"""
+    # Plain names joined onto a fixed directory need none of os.path.join's normalization
+    dir_prefix = f"{os.fspath(blog_dir)}{os.sep}"
+    
+    def replace(pair):
+        old_name, new_name = pair
         try:
-            os.rename(old_path, new_path)
-            logger.info(f"Renamed: {old_name} -> {new_name}")
-            serial_number += 1
-        except Exception as e:
-            logger.error(f"Error renaming {old_name}: {e}")
+            os.replace(f"{dir_prefix}{old_name}", f"{dir_prefix}{new_name}")
+            return True
+        except OSError as e:
+            logger.error("Error renaming %s: %s", old_name, e)
+            return False
+    
+    if len(pairs) < 4:
+        results = [replace(pair) for pair in pairs]
+    else:
+        # os.replace releases the GIL, so threads overlap the syscalls on slow (network) filesystems
+        with ThreadPoolExecutor(max_workers=min(32, len(pairs))) as executor:
+            results = list(executor.map(replace, pairs))
+    
+    return [pair for pair, ok in zip(pairs, results) if ok]
+
+def apply_rename_plan(blog_dir, plan):
+    """
+    Apply a list of (old_name, new_name) renames inside blog_dir.
+
+    When a target name is still held by another file in the plan, every file is
+    first moved to a temporary name so no rename can clobber a pending source.
+    If any file cannot be staged, the staged ones are moved back and OSError is raised.
+    """
+    new_names = [new_name for _, new_name in plan]
+    if len(set(new_names)) != len(new_names):
+        raise ValueError("Rename plan maps several files to the same name")
+    
+    if {old_name for old_name, _ in plan}.isdisjoint(new_names):
+        renamed = _replace_all(blog_dir, plan)
+    else:
+        suffix = f".renaming-{os.getpid()}"
+        targets = {old_name + suffix: new_name for old_name, new_name in plan}
+        staged = _replace_all(blog_dir, [(old_name, old_name + suffix) for old_name, _ in plan])
+        if len(staged) != len(plan):
+            # A file that could not be staged still holds its name, and another file may
+            # be due to move onto it; put the staged files back rather than clobber it
+            staged_names = {old_name for old_name, _ in staged}
+            skipped = [(old_name, new_name) for old_name, new_name in plan if old_name not in staged_names]
+            logger.error("Could not stage %d file(s), renaming nothing:\n%s", len(skipped),
+                         "\n".join(f"  {old_name} -> {new_name}" for old_name, new_name in skipped))
+            restored = _replace_all(blog_dir, [(tmp_name, old_name) for old_name, tmp_name in staged])
+            if len(restored) != len(staged):
+                logger.error("Some staged files keep their %s suffix and need renaming by hand", suffix)
+            raise OSError(f"Could not stage {len(skipped)} file(s) for renaming")
+        moved = _replace_all(blog_dir, [(tmp_name, targets[tmp_name]) for _, tmp_name in staged])
+        renamed = [(tmp_name[:-len(suffix)], new_name) for tmp_name, new_name in moved]
+    
+    # Report all renames at once instead of once per file; the listing is only built
+    # when INFO records are actually emitted
+    if renamed and logger.isEnabledFor(logging.INFO):
+        lines = "\n".join(f"  {old_name} -> {new_name}" for old_name, new_name in renamed)
+        logger.info("Renamed %d file(s):\n%s", len(renamed), lines)
 
 def parse_arguments():
     """Parse command line arguments"""
@@ -124,7 +144,7 @@ def main():
         rename_files(input_folder=args.input_folder)
         logger.info("File renaming process completed")
     except Exception as e:
-        logger.error(f"Error in main: {e}")
+        logger.error("Error in main: %s", e)
         raise
 
 if __name__ == "__main__":
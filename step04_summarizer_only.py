@@ -10,30 +10,130 @@ Usage:
 """
 
 import os
-import re
+import mmap
+import itertools
 import shutil
 import argparse
 from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from progress_utils import ProgressTracker
 
+# Headings that open and close the extracted section (files are handled as raw UTF-8 bytes)
+_KEY_TAKEAWAYS = b'KEY TAKEAWAYS:'
+_ORIGINAL_TEXT = b'ORIGINAL TEXT:'
+
+# Number of files between progress updates
+PROGRESS_BATCH_SIZE = 32
+
+# Markdown heading written in front of every extracted section
+_OUTPUT_HEADING = b'## KEY TAKEAWAYS:\n\n'
+
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 64 * 1024
+
+def _skip_whitespace(content, pos):
+    """Return the index of the first non-whitespace character at or after pos"""
+    end = len(content)
+    while pos < end and content[pos:pos + 1].isspace():
+        pos += 1
+    return pos
+
+def _find_section_end(content, pos):
+    """
+    Return the index of the newline that starts the ORIGINAL TEXT heading
+    (optionally prefixed with ##) at or after pos, or len(content) if there is none.
+    """
+    while True:
+        heading = content.find(_ORIGINAL_TEXT, pos)
+        if heading < 0:
+            return len(content)
+
+        # Only whitespace and an optional ## may sit between the newline and the heading
+        newline = content.rfind(b'\n', pos, heading)
+        if newline >= 0 and content[newline + 1:heading].strip() in (b'', b'##'):
+            return newline
+
+        pos = heading + len(_ORIGINAL_TEXT)
+
 def extract_key_takeaways(content):
     """
-    Extract only the KEY TAKEAWAYS section from the content.
-    Returns None if no KEY TAKEAWAYS section is found.
+    Extract the body of the KEY TAKEAWAYS section from the content.
+    Works on the raw file bytes (or an mmap of them), since both headings are plain ASCII.
+    Returns None if no KEY TAKEAWAYS section is found; the caller adds the output heading.
     """
-    # Find the KEY TAKEAWAYS section - handle different formatting variations
-    key_takeaways_match = re.search(r'(?:##\s*)?KEY TAKEAWAYS:(?:\s*\*\*)?\s*(.*?)(?=\n\s*(?:##\s*)?ORIGINAL TEXT:|$)',
-                                   content, re.DOTALL)
+    # Literal bytes.find scans are much cheaper than a regex for these fixed headings
+    header = content.find(_KEY_TAKEAWAYS)
     
-    if not key_takeaways_match:
+    if header < 0:
         # Return None when no KEY TAKEAWAYS found
         return None
     
+    # Skip whitespace and an optional bold marker after the heading
+    start = _skip_whitespace(content, header + len(_KEY_TAKEAWAYS))
+    if content[start:start + 2] == b'**':
+        start = _skip_whitespace(content, start + 2)
+
+    # The section runs until the ORIGINAL TEXT heading, or to the end of the file
+    end = _find_section_end(content, start)
+
     # Get the key takeaways content
-    key_takeaways = key_takeaways_match.group(1).strip()
+    return content[start:end].strip()
 
-    # Format the output with markdown
-    return f"## KEY TAKEAWAYS:\n\n{key_takeaways}"
+def process_file(filename, input_file_path, output_dir):
+    """
+    Extract the KEY TAKEAWAYS of a single file into output_dir.
+
+    Args:
+        filename (str): Name of the input file
+        input_file_path (str): Full path of the input file
+        output_dir (str): Directory where the extracted takeaways are saved
+
+    Returns:
+        bool: True if a KEY TAKEAWAYS section was found and written, False otherwise
+    """
+    # Scan the raw content of the file; no decode is needed to find the ASCII headings.
+    # Large files are searched through an mmap of the page cache, so only the
+    # extracted section is ever copied into Python memory
+    with open(input_file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                key_takeaways = extract_key_takeaways(content)
+        else:
+            key_takeaways = extract_key_takeaways(file.read())
+
+    # Only create output file if KEY TAKEAWAYS section was found
+    if key_takeaways is None:
+        return False
+
+    # Write the key takeaways to the corresponding file with .md extension
+    base_filename = os.path.splitext(filename)[0]
+    output_file_path = f"{output_dir}{os.sep}{base_filename}.md"
+    with open(output_file_path, 'wb') as file:
+        # Heading and body go out as two buffers, without building a concatenated copy
+        file.writelines((_OUTPUT_HEADING, key_takeaways))
+
+    return True
+
+def iter_input_files(input_dir):
+    """Yield (filename, path) for each regular file in input_dir, one directory entry at a time"""
+    with os.scandir(input_dir) as it:
+        for entry in it:
+            # DirEntry caches the file type from the directory read, so no extra stat per file
+            if entry.is_file():
+                yield entry.name, entry.path
+
+def submit_in_order(executor, files, output_dir, window):
+    """
+    Submit files to the executor and yield (filename, future) pairs in input order,
+    keeping at most `window` files in flight so memory does not grow with the directory.
+    """
+    pending = deque()
+    for filename, input_file_path in files:
+        pending.append((filename, executor.submit(process_file, filename, input_file_path, output_dir)))
+        if len(pending) >= window:
+            yield pending.popleft()
+    yield from pending
 
 def process_files(input_dir, output_dir):
     """
@@ -48,56 +148,54 @@ def process_files(input_dir, output_dir):
         os.makedirs(output_dir)
         print(f"Created output directory: {output_dir}")
 
-    # Get list of files to process
-    files_to_process = []
-    for filename in os.listdir(input_dir):
-        input_file_path = os.path.join(input_dir, filename)
-        if os.path.isfile(input_file_path):
-            files_to_process.append((filename, input_file_path))
+    # Stream the directory instead of materializing the full file list
+    files = iter_input_files(input_dir)
+    first_file = next(files, None)
 
-    if not files_to_process:
+    if first_file is None:
         print(f"No files found in '{input_dir}'")
         return
 
-    # Initialize progress tracker
+    # Initialize progress tracker; the total is unknown while the directory is streamed
     progress_tracker = ProgressTracker(
-        total_items=len(files_to_process),
+        total_items=None,
         task_name="Key Takeaways Extraction"
     )
     progress_tracker.start()
 
-    # Process each file
-    for filename, input_file_path in files_to_process:
-        try:
-            progress_tracker.start_item(filename)
-
-            # Read the content of the file
-            with open(input_file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-
-            # Extract the key takeaways
-            key_takeaways = extract_key_takeaways(content)
-
-            # Only create output file if KEY TAKEAWAYS section was found
-            if key_takeaways is not None:
-                # Write the key takeaways to the corresponding file with .md extension
-                base_filename = os.path.splitext(filename)[0]
-                output_file_path = os.path.join(output_dir, f"{base_filename}.md")
-                with open(output_file_path, 'w', encoding='utf-8') as file:
-                    file.write(key_takeaways)
-
-                progress_tracker.complete_item(filename, success=True)
-            else:
-                # No takeaways found, but not an error
-                progress_tracker.complete_item(filename, success=True)
-                print(f"   ℹ️  No KEY TAKEAWAYS section found")
-
-        except Exception as e:
-            progress_tracker.complete_item(filename, success=False)
-            print(f"   Error processing {filename}: {e}")
+    # Read, extract and write files on a thread pool; progress is reported from
+    # this thread in input order, so the tracker output never interleaves
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    output_dir = os.fspath(output_dir).rstrip(os.sep)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = submit_in_order(
+            executor, itertools.chain([first_file], files), output_dir, window=max_workers * 2
+        )
+
+        # Report progress in batches; per-file progress output costs more than the extraction itself
+        successful = failed = missing = 0
+        for count, (filename, future) in enumerate(results, 1):
+            try:
+                # A file without KEY TAKEAWAYS is not an error
+                if not future.result():
+                    missing += 1
+                successful += 1
+
+            except Exception as e:
+                failed += 1
+                print(f"\n   Error processing {filename}: {e}")
+
+            if count % PROGRESS_BATCH_SIZE == 0:
+                progress_tracker.bump(successful, failed)
+                successful = failed = 0
+
+        if successful or failed:
+            progress_tracker.bump(successful, failed)
 
     # Show final summary
     progress_tracker.finish()
+    if missing:
+        print(f"  ℹ️  No KEY TAKEAWAYS section found in {missing} file(s)")
     print(f"  📁 Output directory: {output_dir}")
 
 if __name__ == "__main__":
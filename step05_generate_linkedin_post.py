@@ -18,6 +18,9 @@ Usage:
     python step05_generate_linkedin_post.py -i /path/to/ryan-summarize
     # Output will be saved to /path/to/ryan-post
 
+    # Submit all posts as one Azure OpenAI Batch job (cheaper, up to 24h turnaround)
+    python step05_generate_linkedin_post.py -i /path/to/ryan-summarize --batch
+
     # Specify custom input and output directories
     python step05_generate_linkedin_post.py -i <input_directory> -o <output_directory>
 
@@ -38,11 +41,21 @@ Example:
 
 import os
 import re
+import json
+import time
+import sqlite3
+import hashlib
 import argparse
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 from time import sleep
-from collections import defaultdict
+from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
 from dotenv import load_dotenv
 from progress_utils import ProgressTracker, setup_logging
 
@@ -52,17 +65,349 @@ load_dotenv()
 # Configure logging
 logger = setup_logging(__name__)
 
+# Precompiled filename and section patterns, used for every file
+_SERIAL_PREFIX_RE = re.compile(r'^\d+-')
+_PART_SUFFIX_RE = re.compile(r'\s*[-_]+part\d+$')
+_PART_NUM_RE = re.compile(r'[-_]+part(\d+)')
+_TAKEAWAYS_RE = re.compile(
+    r'(?:##\s*)?KEY TAKEAWAYS:(?:\s*\*\*)?\s*(.*?)(?=\n\s*##\s*(?:SUMMARY|ORIGINAL TEXT|KEY TAKEAWAYS):|\Z)',
+    re.DOTALL | re.IGNORECASE
+)
+_JSON_CODE_BLOCK_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Marker scanned for with str.find in lowercased content, and the heading that closes a section
+_TAKEAWAYS_MARKER = 'key takeaways:'
+_SECTION_END_RE = re.compile(r'\n\s*##\s*(?:SUMMARY|ORIGINAL TEXT|KEY TAKEAWAYS):', re.IGNORECASE)
+
+
+def _skip_whitespace(text, pos):
+    """Return the index of the first non-whitespace character at or after pos"""
+    end = len(text)
+    while pos < end and text[pos].isspace():
+        pos += 1
+    return pos
+
+
+def find_takeaways_sections(content):
+    """
+    Find the body of every KEY TAKEAWAYS section in the content.
+    Equivalent to _TAKEAWAYS_RE.findall, but locates the headings with str.find.
+
+    Args:
+        content: Text to search
+
+    Returns:
+        List of unstripped section bodies
+    """
+    lowered = content.lower()
+
+    # Offsets in the lowercased copy must line up with content, and 'ſ' must not be
+    # present since the IGNORECASE regex matches it as 's' but lower() keeps it
+    if len(lowered) != len(content) or '\u017f' in content:
+        return _TAKEAWAYS_RE.findall(content)
+
+    sections = []
+    heading = lowered.find(_TAKEAWAYS_MARKER)
+    while heading >= 0:
+        # Skip whitespace and an optional bold marker after the heading
+        start = _skip_whitespace(content, heading + len(_TAKEAWAYS_MARKER))
+        if content.startswith('**', start):
+            start = _skip_whitespace(content, start + 2)
+
+        # The section runs until the next SUMMARY/ORIGINAL TEXT/KEY TAKEAWAYS heading, or to the end
+        end_match = _SECTION_END_RE.search(content, start)
+        end = end_match.start() if end_match else len(content)
+        sections.append(content[start:end])
+
+        heading = lowered.find(_TAKEAWAYS_MARKER, end)
+
+    return sections
+
+
+# Field-by-field guide shared by the single-post and packed prompts
+_POST_FIELD_INSTRUCTIONS = """PostTitle: A compelling, attention-grabbing title for the post - keep it under 100 characters
+
+Categories: Provide 2-4 relevant categories/tags for this content as an array. Examples: investing, finance, entrepreneurship, technology, business strategy, etc.
+
+CatchyIntro: Write 1-2 punchy opening lines that hook the reader - this is the first thing they'll see. Make it intriguing, ask a question, or make a bold statement. This should be a single paragraph that flows naturally.
+
+PostContent: Main body of the post with the key insights presented as bullet points. Follow these guidelines:
+1. Use bullet points (with - ) for each key insight
+2. Include relevant emojis at the start of each bullet point (one emoji per bullet)
+3. Make each bullet point bold with a short heading, followed by explanation
+4. Keep it concise but informative
+5. Focus on value and actionable insights
+6. Use short paragraphs within each bullet if needed for clarity
+7. Add 3-5 relevant hashtags at the end of this section
+
+EndingThoughtsAndQuestion: A thought-provoking closing statement or call-to-action question that encourages engagement and comments. This should make readers reflect or want to share their experience. Write 2-3 sentences that connect the insights to practical applications."""
+
+# System prompts carry the full, unchanging instructions so every request starts with the
+# same prefix, which Azure OpenAI caches; only the takeaways go into the user message
+_POST_SYSTEM_PROMPT = f"""You are an expert LinkedIn content creator who writes engaging, professional posts that drive engagement and provide value. You always return valid JSON responses.
+
+Transform the key takeaways in the user message into a structured, engaging LinkedIn post.
+
+Please provide your response as a valid JSON object with these fields:
+
+{{
+  "PostTitle": "A compelling, attention-grabbing title for the post - keep it under 100 characters",
+  "Categories": ["category1", "category2", "category3", "category4"],
+  "CatchyIntro": "Your catchy intro text here",
+  "PostContent": "Your post content here",
+  "EndingThoughtsAndQuestion": "Your ending thoughts here"
+}}
+
+Field Instructions:
+
+{_POST_FIELD_INSTRUCTIONS}
+
+IMPORTANT: Return ONLY a valid JSON object. Do not include any text before or after the JSON. Maintain professional but approachable tone."""
+
+_PACKED_SYSTEM_PROMPT = f"""You are an expert LinkedIn content creator who writes engaging, professional posts that drive engagement and provide value. You always return valid JSON responses.
+
+The user message contains several sets of key takeaways, each under a "## Source <source id>" heading. Transform each set into its own structured, engaging LinkedIn post.
+
+Please provide your response as a valid JSON object with one entry per source, keyed by the source id:
+
+{{
+  "<source id>": {{
+    "PostTitle": "A compelling, attention-grabbing title for the post - keep it under 100 characters",
+    "Categories": ["category1", "category2", "category3", "category4"],
+    "CatchyIntro": "Your catchy intro text here",
+    "PostContent": "Your post content here",
+    "EndingThoughtsAndQuestion": "Your ending thoughts here"
+  }}
+}}
+
+Field Instructions (apply to every post):
+
+{_POST_FIELD_INSTRUCTIONS}
+
+IMPORTANT: Return ONLY a valid JSON object with exactly one entry for each source id. Do not include any text before or after the JSON. Maintain professional but approachable tone."""
+
+# Jekyll post date format
+_DATE_FMT = '%Y-%m-%d %H:%M:%S +0900'
+
+# Jekyll post layout: frontmatter followed by the post body
+_JEKYLL_TEMPLATE = """---
+layout: post
+title:  "{title}"
+date:   {date}
+categories: {categories}
+---
+**{title}**
+
+{intro}
+
+{content}
+
+
+**Why It Matters**
+{why}.
+
+**Your Turn**
+{ending}
+"""
+
+# Default location of the persistent API response cache
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "mcp-moat" / "linkedin_posts.sqlite"
+
+
+class ResponseCache:
+    """A persistent SQLite cache of API responses keyed by a hash of the request"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=7 * 24 * 3600):
+        """
+        Open (or create) the cache database
+
+        Args:
+            path: Path of the SQLite database file
+            ttl: Seconds a cached response stays valid
+        """
+        self.ttl = ttl
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # One connection shared by the worker threads, serialized with a lock
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response TEXT, created_at INT)"
+            )
+
+    @staticmethod
+    def make_key(*parts):
+        """
+        Build a cache key from the request parts
+
+        Args:
+            parts: JSON-serializable values that fully determine the response
+
+        Returns:
+            SHA256 hex digest of the canonical JSON of the parts
+        """
+        canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Return the cached response for key, or None if missing or expired"""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT response FROM responses WHERE key = ? AND created_at > ?",
+                (key, int(time.time()) - self.ttl)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key, response):
+        """Store a response under key"""
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+                (key, response, int(time.time()))
+            )
+
+
+class AzureRateLimiter:
+    """
+    A proactive limiter that keeps requests under the deployment's RPM/TPM quota.
+
+    Requests and their estimated tokens are tracked over a sliding one-minute window,
+    the window is corrected from Azure's x-ratelimit-remaining-* response headers, and
+    the concurrency cap backs off multiplicatively on 429s and regrows additively.
+    """
+
+    WINDOW = 60  # Seconds covered by the RPM/TPM quota
+
+    def __init__(self, rpm=60, tpm=120000, max_concurrency=10):
+        """
+        Initialize the rate limiter
+
+        Args:
+            rpm: Requests allowed per minute
+            tpm: Tokens allowed per minute
+            max_concurrency: Upper bound for requests in flight
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_concurrency = max_concurrency
+        self.concurrency = max_concurrency
+        self.in_flight = 0
+        self.successes = 0
+
+        # (timestamp, tokens) of requests sent in the current window
+        self.window = deque()
+        self.window_tokens = 0
+
+        # Remaining quota last reported by the server, and when it was reported
+        self.remaining_requests = None
+        self.remaining_tokens = None
+        self.reported_at = 0
+
+        self.condition = threading.Condition()
+
+    def _prune(self, now):
+        """Drop requests that left the sliding window"""
+        while self.window and self.window[0][0] <= now - self.WINDOW:
+            self.window_tokens -= self.window.popleft()[1]
+
+    def _wait_time(self, now, tokens):
+        """Return 0 if a request of this size may be sent now, otherwise the seconds to wait"""
+        if self.in_flight >= self.concurrency:
+            return None  # Woken up by release()
+
+        # Server-reported quota is authoritative until the window it describes has passed
+        if now - self.reported_at < self.WINDOW:
+            if self.remaining_requests is not None and self.remaining_requests < 1:
+                return self.reported_at + self.WINDOW - now
+            if self.remaining_tokens is not None and self.remaining_tokens < tokens:
+                return self.reported_at + self.WINDOW - now
+
+        if self.window and (len(self.window) >= self.rpm or self.window_tokens + tokens > self.tpm):
+            return self.window[0][0] + self.WINDOW - now
+
+        return 0
+
+    def acquire(self, tokens):
+        """
+        Block until a request of the estimated size fits in the quota, then reserve it
+
+        Args:
+            tokens: Estimated prompt plus completion tokens of the request
+        """
+        with self.condition:
+            while True:
+                now = time.monotonic()
+                self._prune(now)
+                wait = self._wait_time(now, tokens)
+                if wait == 0:
+                    break
+                self.condition.wait(wait)
+
+            self.in_flight += 1
+            self.window.append((now, tokens))
+            self.window_tokens += tokens
+            if self.remaining_requests is not None:
+                self.remaining_requests -= 1
+            if self.remaining_tokens is not None:
+                self.remaining_tokens -= tokens
+
+    @staticmethod
+    def _parse_remaining(headers, name):
+        """Return a remaining-quota header as an int, or None if it is missing or malformed"""
+        try:
+            return int(headers[name])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def release(self, status_code=None, headers=None):
+        """
+        Finish a request reserved with acquire()
+
+        Args:
+            status_code: HTTP status of the response, if one was received
+            headers: Response headers carrying x-ratelimit-remaining-* values
+        """
+        with self.condition:
+            self.in_flight -= 1
+
+            if headers is not None:
+                remaining_requests = self._parse_remaining(headers, 'x-ratelimit-remaining-requests')
+                remaining_tokens = self._parse_remaining(headers, 'x-ratelimit-remaining-tokens')
+                if remaining_requests is not None or remaining_tokens is not None:
+                    self.reported_at = time.monotonic()
+                    self.remaining_requests = remaining_requests
+                    self.remaining_tokens = remaining_tokens
+
+            if status_code == 429:
+                # Multiplicative decrease
+                self.concurrency = max(1, self.concurrency // 2)
+                self.successes = 0
+            elif status_code == 200 and self.concurrency < self.max_concurrency:
+                # Additive increase: one more slot per round of successful requests
+                self.successes += 1
+                if self.successes >= self.concurrency:
+                    self.concurrency += 1
+                    self.successes = 0
+
+            self.condition.notify_all()
+
 
 class LinkedInPostGenerator:
     """A class to generate LinkedIn posts from key takeaways using Azure OpenAI API"""
 
-    def __init__(self, input_folder=None, output_folder=None):
+    def __init__(self, input_folder=None, output_folder=None, batch=False, use_cache=True, pack_size=1):
         """
         Initialize the LinkedIn post generator
 
         Args:
             input_folder: Directory containing key takeaways files
             output_folder: Directory where LinkedIn posts will be saved
+            batch: Generate the posts through the Azure OpenAI Batch API instead of live requests
+            use_cache: Reuse API responses cached for identical requests
+            pack_size: Number of file groups sent together in one live API request
         """
         # Use provided input folder or default
         if input_folder is None:
@@ -94,6 +439,8 @@ class LinkedInPostGenerator:
         self.api_endpoint = os.getenv('AZURE_OPENAI_ENDPOINT')
         self.deployment_name = os.getenv('AZURE_OPENAI_DEPLOYMENT')
         self.api_version = os.getenv('AZURE_OPENAI_API_VERSION', '2024-02-15-preview')
+        # The files/batches API only exists from 2024-10-21 on, so --batch has its own version
+        self.batch_api_version = os.getenv('AZURE_OPENAI_BATCH_API_VERSION', '2024-10-21')
 
         # Construct the API URL
         self.api_url = f"{self.api_endpoint}openai/deployments/{self.deployment_name}/chat/completions?api-version={self.api_version}"
@@ -112,9 +459,38 @@ class LinkedInPostGenerator:
         }
 
         # Rate limiting configuration
-        self.request_delay = 2  # Delay between requests in seconds
-        self.retry_delay = 60   # Delay when hitting rate limits
+        self.retry_delay = 60   # Delay when hitting rate limits without a retry-after hint
         self.max_retries = 5    # Maximum number of retries per request
+        self.max_workers = 10   # File groups processed concurrently (Azure's default connection cap)
+        self.pack_size = max(1, pack_size)  # File groups per request; >1 saves requests when RPM-bound
+
+        # Proactive pacing under the deployment quota (Azure's defaults unless configured)
+        self.rate_limiter = AzureRateLimiter(
+            rpm=int(os.getenv('AZURE_OPENAI_RPM', 60)),
+            tpm=int(os.getenv('AZURE_OPENAI_TPM', 120000)),
+            max_concurrency=self.max_workers
+        )
+
+        # One keep-alive session for all API calls, with a connection per worker thread
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers))
+
+        # Posts generated in this run by normalized takeaways hash, so groups with
+        # identical takeaways share one API call even while it is still in flight
+        self._content_posts = {}
+        self._content_lock = threading.Lock()
+
+        # Post names in the output folder, filled by get_unprocessed_file_groups
+        self._processed_files = None
+
+        # Batch API configuration
+        self.batch = batch
+        self.batch_poll_delay = 30       # First wait between batch status checks in seconds
+        self.batch_max_poll_delay = 600  # Upper bound for the exponential poll backoff
+
+        # Persistent response cache; reruns with unchanged input skip the API entirely
+        self.cache = ResponseCache() if use_cache else None
 
     def setup_folders(self):
         """Create output folder if it doesn't exist"""
@@ -135,11 +511,11 @@ class LinkedInPostGenerator:
         name_without_ext = os.path.splitext(filename)[0]
 
         # Remove serial number prefix if present (e.g., 001-, 002-, etc.)
-        name_without_serial = re.sub(r'^\d+-', '', name_without_ext)
+        name_without_serial = _SERIAL_PREFIX_RE.sub('', name_without_ext)
 
         # Remove part suffixes - handles multiple patterns:
         # --part01 (double dash), -part01 (single dash), _part1 (underscore)
-        base_name = re.sub(r'\s*[-_]+part\d+$', '', name_without_serial)
+        base_name = _PART_SUFFIX_RE.sub('', name_without_serial)
 
         return base_name
 
@@ -154,7 +530,7 @@ class LinkedInPostGenerator:
             Part number as integer, or 0 if no part number found
         """
         # Match patterns: --part01, -part01, _part1
-        match = re.search(r'[-_]+part(\d+)', filename)
+        match = _PART_NUM_RE.search(filename)
         return int(match.group(1)) if match else 0
 
     def group_files_by_base_name(self):
@@ -164,26 +540,30 @@ class LinkedInPostGenerator:
         Returns:
             Dictionary mapping base names to sorted lists of file paths
         """
-        if not os.path.exists(self.input_folder):
+        # A single scandir pass; DirEntry carries the file type and full path
+        try:
+            it = os.scandir(self.input_folder)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Input folder not found: {self.input_folder}")
 
-        file_groups = defaultdict(list)
-
-        for filename in os.listdir(self.input_folder):
-            if filename.endswith('.md') or filename.endswith('.txt'):
-                base_name = self.get_base_name(filename)
-                file_path = os.path.join(self.input_folder, filename)
-                part_number = self.get_part_number(filename)
-
-                file_groups[base_name].append({
-                    'path': file_path,
-                    'filename': filename,
-                    'part_number': part_number
-                })
-
-        # Sort files within each group by part number
-        for base_name in file_groups:
-            file_groups[base_name].sort(key=lambda x: x['part_number'])
+        with it:
+            entries = [
+                (self.get_base_name(entry.name), self.get_part_number(entry.name), entry.name, entry.path)
+                for entry in it
+                # Skip hidden files such as macOS ._ resource forks
+                if not entry.name.startswith('.') and entry.name.endswith(('.md', '.txt')) and entry.is_file()
+            ]
+
+        # One sort orders the groups by base name and the files within each group by part number,
+        # so each group is a consecutive run of entries
+        entries.sort()
+        file_groups = {
+            base_name: [
+                {'path': path, 'filename': filename, 'part_number': part_number}
+                for _, part_number, filename, path in group
+            ]
+            for base_name, group in groupby(entries, key=itemgetter(0))
+        }
 
         return file_groups
 
@@ -195,12 +575,18 @@ class LinkedInPostGenerator:
             Dictionary of unprocessed file groups
         """
         # Get already processed files
+        # One scandir call; a missing output folder just means nothing was processed yet
         processed_files = set()
-        if os.path.exists(self.output_folder):
-            for file in os.listdir(self.output_folder):
-                if file.endswith('.md'):
-                    base_name = os.path.splitext(file)[0]
-                    processed_files.add(base_name)
+        try:
+            with os.scandir(self.output_folder) as it:
+                for entry in it:
+                    if entry.name.endswith('.md'):
+                        processed_files.add(entry.name[:-3])
+        except FileNotFoundError:
+            pass
+
+        # Kept for get_all_generated_posts, which would otherwise list the folder again
+        self._processed_files = processed_files
 
         # Get all file groups
         all_file_groups = self.group_files_by_base_name()
@@ -225,30 +611,32 @@ class LinkedInPostGenerator:
         Returns:
             Tuple of (merged_content, structured_original_content)
         """
-        merged_content = []
-        structured_parts = []
-
-        for file_info in file_list:
-            file_path = file_info['path']
-            filename = file_info['filename']
-            logger.info(f"  Reading part: {filename}")
-
+        def read_part(file_info):
+            logger.info(f"  Reading part: {file_info['filename']}")
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    merged_content.append(content)
-
-                    # Store structured version with filename for original takeaways section
-                    structured_parts.append({
-                        'filename': filename,
-                        'content': content
-                    })
+                with open(file_info['path'], 'r', encoding='utf-8') as f:
+                    return f.read()
             except Exception as e:
-                logger.error(f"  Error reading {file_path}: {e}")
-                continue
+                logger.error(f"  Error reading {file_info['path']}: {e}")
+                return None
+
+        # Read the parts concurrently; on network filesystems each open costs a round trip.
+        # map() keeps the part order
+        if len(file_list) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(file_list))) as executor:
+                contents = list(executor.map(read_part, file_list))
+        else:
+            contents = [read_part(file_info) for file_info in file_list]
+
+        # Store structured version with filename for original takeaways section
+        structured_parts = [
+            {'filename': file_info['filename'], 'content': content}
+            for file_info, content in zip(file_list, contents)
+            if content is not None
+        ]
 
         # Join all parts with double newline separator for extraction
-        merged_for_extraction = "\n\n".join(merged_content)
+        merged_for_extraction = "\n\n".join(part['content'] for part in structured_parts)
 
         return merged_for_extraction, structured_parts
 
@@ -262,22 +650,10 @@ class LinkedInPostGenerator:
         Returns:
             Extracted key takeaways or None if not found
         """
-        # Find all KEY TAKEAWAYS sections - handle different formatting variations
-        # Pattern 1: Look for KEY TAKEAWAYS: followed by content until next section or end
-        takeaways_sections = re.findall(
-            r'(?:##\s*)?KEY TAKEAWAYS:(?:\s*\*\*)?\s*(.*?)(?=\n\s*##\s*(?:SUMMARY|ORIGINAL TEXT|KEY TAKEAWAYS):|\Z)',
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
-
-        # If pattern 1 didn't find anything, try a simpler pattern for files that contain only KEY TAKEAWAYS
-        if not takeaways_sections:
-            # Check if the content starts with KEY TAKEAWAYS: (with or without ##)
-            if re.match(r'^(?:##\s*)?KEY TAKEAWAYS:', content.strip(), re.IGNORECASE):
-                # Extract everything after "KEY TAKEAWAYS:"
-                match = re.search(r'^(?:##\s*)?KEY TAKEAWAYS:\s*(.*)', content.strip(), re.DOTALL | re.IGNORECASE)
-                if match:
-                    return match.group(1).strip()
+        # Find all KEY TAKEAWAYS sections - handle different formatting variations.
+        # Every KEY TAKEAWAYS: heading yields a section (running to the next heading or
+        # the end), including files that contain only KEY TAKEAWAYS, so no fallback is needed
+        takeaways_sections = find_takeaways_sections(content)
 
         if not takeaways_sections:
             return None
@@ -304,37 +680,110 @@ class LinkedInPostGenerator:
         Returns:
             API response JSON
         """
+        # Serialize the payload once, compact and without \u escapes for non-ASCII text
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+
+        # Reserve room in the RPM/TPM quota up front instead of reacting to 429s;
+        # roughly 4 bytes per prompt token, plus the completion budget
+        estimated_tokens = len(body) // 4 + payload.get('max_tokens', 0)
+        self.rate_limiter.acquire(estimated_tokens)
+
+        # The reserved slot must be returned however the request ends, or the limiter
+        # eventually runs out of slots and every later acquire() blocks for good
+        response = None
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.api_url,
-                headers=self.headers,
-                json=payload,
+                data=body,
                 timeout=120
             )
-
-            if response.status_code == 429:  # Rate limit exceeded
-                logger.warning("Rate limit exceeded. Waiting before retry...")
-                sleep(self.retry_delay)
-                raise Exception("Rate limit exceeded")
-            elif response.status_code == 401:  # Unauthorized
-                logger.error("API authentication failed. Check your API key.")
-                raise Exception("API authentication failed")
-            elif response.status_code == 400:  # Bad request
-                logger.error(f"Bad request: {response.text}")
-                raise Exception(f"Bad request: {response.text}")
-            elif response.status_code != 200:
-                logger.error(f"API request failed with status code: {response.status_code}, response: {response.text}")
-                raise Exception(f"API request failed with status code: {response.status_code}")
-
-            # Parse the response
-            json_response = response.json()
-            return json_response
-
         except requests.exceptions.RequestException as e:
             logger.error(f"Request error: {e}")
             raise
         finally:
-            sleep(self.request_delay)  # Rate limiting delay
+            if response is None:
+                self.rate_limiter.release()
+            else:
+                self.rate_limiter.release(response.status_code, response.headers)
+
+        if response.status_code == 429:  # Rate limit exceeded
+            # The limiter has already backed off; wait as long as the server asks
+            try:
+                wait = float(response.headers.get('retry-after', self.retry_delay))
+            except ValueError:
+                wait = self.retry_delay
+            logger.warning(f"Rate limit exceeded. Waiting {wait:.0f} seconds before retry...")
+            sleep(wait)
+            raise Exception("Rate limit exceeded")
+        elif response.status_code == 401:  # Unauthorized
+            logger.error("API authentication failed. Check your API key.")
+            raise Exception("API authentication failed")
+        elif response.status_code == 400:  # Bad request
+            logger.error(f"Bad request: {response.text}")
+            raise Exception(f"Bad request: {response.text}")
+        elif response.status_code != 200:
+            logger.error(f"API request failed with status code: {response.status_code}, response: {response.text}")
+            raise Exception(f"API request failed with status code: {response.status_code}")
+
+        # Parse the raw response bytes; json detects the UTF encoding itself
+        json_response = json.loads(response.content)
+        return json_response
+
+    def build_post_payload(self, key_takeaways):
+        """
+        Build the chat completion payload that turns key takeaways into a LinkedIn post
+
+        Args:
+            key_takeaways: The key takeaways content
+
+        Returns:
+            Request payload for the API
+        """
+        return self.build_chat_payload(_POST_SYSTEM_PROMPT, f"Key Takeaways to transform:\n{key_takeaways}")
+
+    def build_chat_payload(self, system_prompt, user_prompt, max_tokens=2500):
+        """
+        Wrap post-generation prompts in a chat completion payload
+
+        Args:
+            system_prompt: Fixed instructions, identical across requests
+            user_prompt: The request-specific content
+            max_tokens: Completion token budget
+
+        Returns:
+            Request payload for the API
+        """
+        payload = {
+            "messages": [
+                {
+                    "role": "system",
+                    "content": system_prompt
+                },
+                {
+                    "role": "user",
+                    "content": user_prompt
+                }
+            ],
+            "max_tokens": max_tokens,
+            "temperature": 0.7,  # Higher temperature for more creative outputs
+            "response_format": { "type": "json_object" },  # Request JSON mode
+            # A stable id per prompt prefix routes requests to the same prompt cache
+            "user": hashlib.sha256(system_prompt.encode('utf-8')).hexdigest()[:32]
+        }
+
+        return payload
+
+    def post_cache_key(self, payload):
+        """
+        Build the response cache key of a request payload
+
+        Args:
+            payload: Request payload for the API
+
+        Returns:
+            Cache key covering the deployment, API version and payload
+        """
+        return ResponseCache.make_key(self.deployment_name, self.api_version, payload)
 
     def generate_linkedin_post(self, key_takeaways):
         """
@@ -346,58 +795,147 @@ class LinkedInPostGenerator:
         Returns:
             Dictionary with structured LinkedIn post sections
         """
-        prompt = f"""You are a professional LinkedIn content creator. Transform the following key takeaways into a structured, engaging LinkedIn post.
+        content_key = self.content_cache_key(key_takeaways)
 
-Please provide your response as a valid JSON object with these fields:
+        with self._content_lock:
+            future = self._content_posts.get(content_key)
+            is_owner = future is None
+            if is_owner:
+                future = self._content_posts[content_key] = Future()
 
-{{
-  "PostTitle": "A compelling, attention-grabbing title for the post - keep it under 100 characters",
-  "Categories": ["category1", "category2", "category3", "category4"],
-  "CatchyIntro": "Your catchy intro text here",
-  "PostContent": "Your post content here",
-  "EndingThoughtsAndQuestion": "Your ending thoughts here"
-}}
+        if not is_owner:
+            logger.info("  Reusing the post generated for identical key takeaways")
+            return future.result()
 
-Field Instructions:
+        try:
+            linkedin_post = self.cache.get(content_key) if self.cache else None
+            if linkedin_post is not None:
+                logger.info("  Using cached LinkedIn post response")
+            else:
+                linkedin_post = self.request_completion(self.build_post_payload(key_takeaways))
+                self.cache_post(content_key, linkedin_post)
+        except Exception as e:
+            # Let a later group with the same takeaways try again
+            with self._content_lock:
+                del self._content_posts[content_key]
+            future.set_exception(e)
+            raise
 
-PostTitle: A compelling, attention-grabbing title for the post - keep it under 100 characters
+        future.set_result(linkedin_post)
+        return linkedin_post
 
-Categories: Provide 2-4 relevant categories/tags for this content as an array. Examples: investing, finance, entrepreneurship, technology, business strategy, etc.
+    def cache_post(self, cache_key, linkedin_post):
+        """
+        Cache a LinkedIn post response once it parses as a JSON object, so a truncated
+        or malformed reply is requested again on the next run instead of replayed
 
-CatchyIntro: Write 1-2 punchy opening lines that hook the reader - this is the first thing they'll see. Make it intriguing, ask a question, or make a bold statement. This should be a single paragraph that flows naturally.
+        Args:
+            cache_key: Response cache key
+            linkedin_post: Raw JSON response from the API
+        """
+        if not self.cache:
+            return
+        try:
+            is_valid = isinstance(json.loads(linkedin_post), dict)
+        except json.JSONDecodeError:
+            is_valid = False
+        if is_valid:
+            self.cache.set(cache_key, linkedin_post)
+        else:
+            logger.warning("  Not caching a LinkedIn post response that is not a JSON object")
 
-PostContent: Main body of the post with the key insights presented as bullet points. Follow these guidelines:
-1. Use bullet points (with - ) for each key insight
-2. Include relevant emojis at the start of each bullet point (one emoji per bullet)
-3. Make each bullet point bold with a short heading, followed by explanation
-4. Keep it concise but informative
-5. Focus on value and actionable insights
-6. Use short paragraphs within each bullet if needed for clarity
-7. Add 3-5 relevant hashtags at the end of this section
+    def content_cache_key(self, key_takeaways):
+        """
+        Build a cache key from the whitespace-normalized key takeaways, so re-emitted
+        sources with the same content map to the same post
 
-EndingThoughtsAndQuestion: A thought-provoking closing statement or call-to-action question that encourages engagement and comments. This should make readers reflect or want to share their experience. Write 2-3 sentences that connect the insights to practical applications.
+        Args:
+            key_takeaways: The key takeaways content
 
-Key Takeaways to transform:
-{key_takeaways}
+        Returns:
+            Cache key covering the deployment, API version, prompt and takeaways
+        """
+        normalized = _WHITESPACE_RE.sub(' ', key_takeaways).strip()
+        return ResponseCache.make_key(self.deployment_name, self.api_version, _POST_SYSTEM_PROMPT, normalized)
 
-IMPORTANT: Return ONLY a valid JSON object. Do not include any text before or after the JSON. Maintain professional but approachable tone."""
+    def build_packed_payload(self, takeaways_by_id):
+        """
+        Build one chat completion payload that turns several sets of key takeaways into
+        one LinkedIn post each, returned as a JSON object keyed by source id
 
-        payload = {
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are an expert LinkedIn content creator who writes engaging, professional posts that drive engagement and provide value. You always return valid JSON responses."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "max_tokens": 2500,
-            "temperature": 0.7,  # Higher temperature for more creative outputs
-            "response_format": { "type": "json_object" }  # Request JSON mode
+        Args:
+            takeaways_by_id: Dictionary mapping source ids to key takeaways content
+
+        Returns:
+            Request payload for the API
+        """
+        sources = "\n\n".join(
+            f"## Source {source_id}\n{key_takeaways}" for source_id, key_takeaways in takeaways_by_id.items()
+        )
+
+        user_prompt = (
+            f"Key Takeaways to transform:\n\n{sources}\n\n"
+            f"Return exactly one entry for each of these source ids: {', '.join(takeaways_by_id)}"
+        )
+
+        return self.build_chat_payload(_PACKED_SYSTEM_PROMPT, user_prompt, max_tokens=2500 * len(takeaways_by_id))
+
+    def generate_linkedin_posts_packed(self, takeaways_by_name):
+        """
+        Generate LinkedIn posts for several file groups with a single API request
+
+        Args:
+            takeaways_by_name: Dictionary mapping base names to key takeaways content
+
+        Returns:
+            Dictionary mapping base names to the raw JSON of their post; groups the
+            model left out of its answer are missing
+        """
+        # Short ids keep the prompt compact and the JSON keys unambiguous
+        names = {f"source-{i}": base_name for i, base_name in enumerate(takeaways_by_name, 1)}
+        payload = self.build_packed_payload(
+            {source_id: takeaways_by_name[base_name] for source_id, base_name in names.items()}
+        )
+        cache_key = self.post_cache_key(payload)
+        response_text = self.cache.get(cache_key) if self.cache else None
+        is_cached = response_text is not None
+        if is_cached:
+            logger.info("  Using cached LinkedIn post response")
+        else:
+            response_text = self.request_completion(payload)
+
+        try:
+            posts = json.loads(response_text)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse packed JSON response: {e}")
+            return {}
+        if not isinstance(posts, dict):
+            logger.error("Packed response is not a JSON object")
+            return {}
+
+        linkedin_posts = {
+            base_name: json.dumps(posts[source_id])
+            for source_id, base_name in names.items()
+            if isinstance(posts.get(source_id), dict)
         }
 
+        # A reply missing some sources is not reused, so the next run asks again for all of them
+        if not is_cached and len(linkedin_posts) == len(names):
+            self.cache_post(cache_key, response_text)
+
+        return linkedin_posts
+
+    def request_completion(self, payload):
+        """
+        Send a chat completion request with retries; callers cache the reply once they
+        have checked it
+
+        Args:
+            payload: Request payload for the API
+
+        Returns:
+            The response message content
+        """
         retry_count = 0
         last_error = None
 
@@ -408,8 +946,7 @@ IMPORTANT: Return ONLY a valid JSON object. Do not include any text before or af
 
                 # Extract the response content
                 if "choices" in response and len(response["choices"]) > 0:
-                    linkedin_post = response["choices"][0]["message"]["content"].strip()
-                    return linkedin_post
+                    return response["choices"][0]["message"]["content"].strip()
                 else:
                     raise Exception("Invalid response format from API")
 
@@ -439,11 +976,10 @@ IMPORTANT: Return ONLY a valid JSON object. Do not include any text before or af
         Returns:
             Dictionary with parsed sections
         """
-        import json
-
         try:
             # Try to parse as JSON directly
-            sections = json.loads(response_text.strip())
+            # json.loads ignores surrounding whitespace, so no stripped copy is needed
+            sections = json.loads(response_text)
 
             # Ensure all required fields are present
             required_fields = ['PostTitle', 'Categories', 'CatchyIntro', 'PostContent', 'EndingThoughtsAndQuestion']
@@ -458,7 +994,7 @@ IMPORTANT: Return ONLY a valid JSON object. Do not include any text before or af
             logger.error(f"Response text: {response_text[:500]}")
 
             # Try to extract JSON from markdown code blocks if present
-            json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
+            json_match = _JSON_CODE_BLOCK_RE.search(response_text)
             if json_match:
                 try:
                     sections = json.loads(json_match.group(1).strip())
@@ -486,10 +1022,8 @@ IMPORTANT: Return ONLY a valid JSON object. Do not include any text before or af
         Returns:
             Formatted Jekyll blog post content
         """
-        from datetime import datetime
-
         # Generate current date in Jekyll format
-        current_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S +0900')
+        current_date = datetime.now().strftime(_DATE_FMT)
 
         # Get categories (already a list from JSON)
         categories_list = sections.get('Categories', ['general'])
@@ -497,56 +1031,37 @@ IMPORTANT: Return ONLY a valid JSON object. Do not include any text before or af
             # Handle if it's a string (fallback)
             categories_list = [cat.strip() for cat in categories_list.split(',')]
 
-        # Build Jekyll frontmatter
-        frontmatter = f"""---
-layout: post
-title:  "{sections['PostTitle']}"
-date:   {current_date}
-categories: {categories_list}
----
-"""
-
-        # Build post content
-        post_body = f"""**{sections['PostTitle']}**
-
-{sections['CatchyIntro']}
-
-{sections['PostContent']}
-
-
-**Why It Matters**
-{sections['EndingThoughtsAndQuestion'].split('?')[0] if '?' in sections['EndingThoughtsAndQuestion'] else sections['EndingThoughtsAndQuestion'].split('.')[0]}.
-
-**Your Turn**
-{sections['EndingThoughtsAndQuestion']}
-"""
-
-        return frontmatter + post_body
-
-    def format_structured_takeaways(self, structured_parts):
+        # "Why It Matters" is the ending up to its first question mark, or else its first sentence
+        ending = sections['EndingThoughtsAndQuestion']
+        why, question_mark, _ = ending.partition('?')
+        if not question_mark:
+            why = ending.partition('.')[0]
+
+        return _JEKYLL_TEMPLATE.format_map({
+            'title': sections['PostTitle'],
+            'date': current_date,
+            'categories': categories_list,
+            'intro': sections['CatchyIntro'],
+            'content': sections['PostContent'],
+            'why': why,
+            'ending': ending,
+        })
+
+    def write_structured_takeaways(self, f, structured_parts):
         """
-        Format the original key takeaways with dividers and file titles
+        Write the original key takeaways with dividers and file titles
 
         Args:
+            f: Text file to write to
             structured_parts: List of dictionaries with 'filename' and 'content'
-
-        Returns:
-            Formatted string with dividers and file titles
         """
-        formatted_sections = []
-
-        for part in structured_parts:
-            filename = part['filename']
-            content = part['content']
-
-            section = f"""### {filename}
----
-
-{content}
-"""
-            formatted_sections.append(section)
-
-        return "\n\n".join(formatted_sections)
+        # Each part goes straight to the file instead of being joined into one large string first
+        for i, part in enumerate(structured_parts):
+            if i:
+                f.write("\n\n")
+            f.write(f"### {part['filename']}\n---\n\n")
+            f.write(part['content'])
+            f.write("\n")
 
     def get_all_generated_posts(self):
         """
@@ -557,22 +1072,31 @@ categories: {categories_list}
         """
         posts = []
 
-        if not os.path.exists(self.output_folder):
-            return posts
-
-        for filename in sorted(os.listdir(self.output_folder)):
-            if filename.endswith('.md') and filename != 'merged-final-post.md':
-                file_path = os.path.join(self.output_folder, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        posts.append({
-                            'filename': filename,
-                            'content': content
-                        })
-                except Exception as e:
-                    logger.error(f"Error reading post {filename}: {e}")
-                    continue
+        if self._processed_files is not None:
+            # Posts found by the startup scan plus the ones saved since; no need to list the folder again
+            filenames = sorted(f"{name}.md" for name in self._processed_files if name != 'merged-final-post')
+        else:
+            try:
+                with os.scandir(self.output_folder) as it:
+                    filenames = sorted(
+                        entry.name for entry in it
+                        if entry.name.endswith('.md') and entry.name != 'merged-final-post.md' and entry.is_file()
+                    )
+            except FileNotFoundError:
+                return posts
+
+        for filename in filenames:
+            file_path = os.path.join(self.output_folder, filename)
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                    posts.append({
+                        'filename': filename,
+                        'content': content
+                    })
+            except Exception as e:
+                logger.error(f"Error reading post {filename}: {e}")
+                continue
 
         return posts
 
@@ -675,29 +1199,262 @@ categories: {categories_list}
             # Generate LinkedIn post
             linkedin_post_raw = self.generate_linkedin_post(key_takeaways)
 
-            # Parse the response into structured sections
-            sections = self.parse_linkedin_post(linkedin_post_raw)
-
-            # Format as Jekyll blog post
-            jekyll_post = self.format_jekyll_post(base_name, sections)
-
-            # Format original key takeaways with dividers and file titles
-            formatted_takeaways = self.format_structured_takeaways(structured_parts)
-
-            # Save to output file with Jekyll format
-            output_file = os.path.join(self.output_folder, f"{base_name}.md")
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(jekyll_post)
-                f.write("\n\n---\n\n")
-                f.write(f"## Original Key Takeaways:\n\n{formatted_takeaways}\n")
-
-            logger.info(f"  Saved LinkedIn post to: {output_file}")
+            self.save_linkedin_post(base_name, linkedin_post_raw, structured_parts)
             return True
 
         except Exception as e:
             logger.error(f"Error processing {base_name}: {e}")
             raise
 
+    def process_file_groups_packed(self, groups):
+        """
+        Process several file groups and generate their LinkedIn posts with a single API request
+
+        Args:
+            groups: List of (base_name, file_list) tuples
+
+        Returns:
+            Dictionary mapping each base name to whether its post was saved
+        """
+        results = {base_name: False for base_name, _ in groups}
+        prepared = {}
+        takeaways_by_name = {}
+
+        for base_name, file_list in groups:
+            logger.info(f"Processing file group: {base_name} ({len(file_list)} parts)")
+            merged_content, structured_parts = self.merge_file_parts(file_list)
+            key_takeaways = self.extract_key_takeaways(merged_content)
+
+            if not key_takeaways:
+                logger.warning(f"No key takeaways found in {base_name}")
+                continue
+
+            prepared[base_name] = structured_parts
+            takeaways_by_name[base_name] = key_takeaways
+
+        if len(takeaways_by_name) == 1:
+            # Nothing to pack; use the regular single-post prompt
+            posts = {base_name: self.generate_linkedin_post(key_takeaways)
+                     for base_name, key_takeaways in takeaways_by_name.items()}
+        elif takeaways_by_name:
+            logger.info(f"  Generating {len(takeaways_by_name)} LinkedIn posts in one request...")
+            posts = self.generate_linkedin_posts_packed(takeaways_by_name)
+        else:
+            posts = {}
+
+        for base_name, linkedin_post_raw in posts.items():
+            self.save_linkedin_post(base_name, linkedin_post_raw, prepared[base_name])
+            results[base_name] = True
+
+        for base_name in takeaways_by_name.keys() - posts.keys():
+            logger.error(f"No post returned for {base_name}")
+
+        return results
+
+    def save_linkedin_post(self, base_name, linkedin_post_raw, structured_parts):
+        """
+        Format a generated LinkedIn post as a Jekyll post and save it with the original takeaways
+
+        Args:
+            base_name: Base name for the file group
+            linkedin_post_raw: Raw JSON response from the API
+            structured_parts: List of dictionaries with 'filename' and 'content'
+        """
+        # Parse the response into structured sections
+        sections = self.parse_linkedin_post(linkedin_post_raw)
+
+        # Format as Jekyll blog post
+        jekyll_post = self.format_jekyll_post(base_name, sections)
+
+        # Save to output file with Jekyll format, followed by the original key takeaways
+        output_file = os.path.join(self.output_folder, f"{base_name}.md")
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(jekyll_post)
+            f.write("\n\n---\n\n## Original Key Takeaways:\n\n")
+            if len(structured_parts) == 1:
+                # A single source file is already on disk as is; point to it instead of copying it
+                f.write(f"> See {structured_parts[0]['filename']}\n")
+            else:
+                self.write_structured_takeaways(f, structured_parts)
+                f.write("\n")
+
+        if self._processed_files is not None:
+            self._processed_files.add(base_name)
+
+        logger.info(f"  Saved LinkedIn post to: {output_file}")
+
+    def batch_request(self, method, path, headers=None, **kwargs):
+        """
+        Send a request to the Azure OpenAI files/batches API
+
+        Args:
+            method: HTTP method
+            path: API path below openai/, e.g. "batches"
+            headers: Headers to add to (or, with None values, remove from) the session headers
+
+        Returns:
+            The HTTP response
+        """
+        url = f"{self.api_endpoint}openai/{path}?api-version={self.batch_api_version}"
+        response = self.session.request(method, url, headers=headers, timeout=300, **kwargs)
+
+        if response.status_code == 401:  # Unauthorized
+            logger.error("API authentication failed. Check your API key.")
+            raise Exception("API authentication failed")
+        elif response.status_code not in (200, 201):
+            logger.error(f"Batch API request failed with status code: {response.status_code}, response: {response.text}")
+            raise Exception(f"Batch API request failed with status code: {response.status_code}")
+
+        return response
+
+    def wait_for_batch_object(self, path, done_statuses):
+        """
+        Poll a batch API object with exponential backoff until it reaches a final status
+
+        Args:
+            path: API path of the object, e.g. "batches/<id>"
+            done_statuses: Statuses that end the wait
+
+        Returns:
+            The object's final JSON
+        """
+        delay = self.batch_poll_delay
+        while True:
+            obj = self.batch_request("GET", path).json()
+            if obj["status"] in done_statuses:
+                return obj
+
+            logger.info(f"  {path} is {obj['status']}, checking again in {delay} seconds")
+            sleep(delay)
+            delay = min(delay * 2, self.batch_max_poll_delay)
+
+    def run_batch_job(self, batch_input):
+        """
+        Upload a JSONL batch of chat completion requests, wait for the job and download its results
+
+        Args:
+            batch_input: JSONL batch input as bytes
+
+        Returns:
+            Dictionary mapping each request's custom_id to its response content
+        """
+        # Upload the input file; multipart upload, so drop the session's JSON content type
+        input_file = self.batch_request(
+            "POST", "files",
+            headers={"Content-Type": None},
+            data={"purpose": "batch"},
+            files={"file": ("batch_input.jsonl", batch_input, "application/jsonl")}
+        ).json()
+        input_file = self.wait_for_batch_object(f"files/{input_file['id']}", ("processed", "error"))
+        if input_file["status"] != "processed":
+            raise Exception(f"Batch input file could not be processed: {input_file.get('status_details')}")
+
+        # Create the batch job and wait for it to finish
+        batch_job = self.batch_request("POST", "batches", json={
+            "input_file_id": input_file["id"],
+            "endpoint": "/chat/completions",
+            "completion_window": "24h"
+        }).json()
+        logger.info(f"Created batch job {batch_job['id']}")
+
+        batch_job = self.wait_for_batch_object(
+            f"batches/{batch_job['id']}", ("completed", "failed", "expired", "cancelled")
+        )
+        if batch_job["status"] != "completed" or not batch_job.get("output_file_id"):
+            raise Exception(f"Batch job {batch_job['id']} ended with status: {batch_job['status']}")
+
+        # Download the results; each line answers one request, in no particular order
+        output = self.batch_request("GET", f"files/{batch_job['output_file_id']}/content")
+
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            response = result.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.error(f"Batch request {result.get('custom_id')} failed: {result.get('error') or response.get('body')}")
+                continue
+            results[result["custom_id"]] = response["body"]["choices"][0]["message"]["content"].strip()
+
+        return results
+
+    def process_groups_in_batch(self, unprocessed_groups, progress_tracker):
+        """
+        Generate the LinkedIn posts of all file groups with a single Azure OpenAI Batch job
+
+        Args:
+            unprocessed_groups: Dictionary of unprocessed file groups
+            progress_tracker: Progress tracker for the run
+        """
+        # Merge and extract every group up front; each uncached group becomes one line of the batch input
+        prepared = {}
+        cache_keys = {}
+        results = {}
+        batch_lines = []
+        first_with_content = {}  # Normalized takeaways hash -> first group with that content
+        duplicates = {}          # Group -> earlier group with identical takeaways
+        for base_name, file_list in unprocessed_groups.items():
+            logger.info(f"Preparing file group: {base_name} ({len(file_list)} parts)")
+            merged_content, structured_parts = self.merge_file_parts(file_list)
+            key_takeaways = self.extract_key_takeaways(merged_content)
+
+            if not key_takeaways:
+                logger.warning(f"No key takeaways found in {base_name}")
+                continue
+
+            prepared[base_name] = structured_parts
+
+            content_key = self.content_cache_key(key_takeaways)
+            if content_key in first_with_content:
+                logger.info(f"  {base_name} has the same key takeaways as {first_with_content[content_key]}")
+                duplicates[base_name] = first_with_content[content_key]
+                continue
+            first_with_content[content_key] = base_name
+
+            cache_keys[base_name] = content_key
+            cached = self.cache.get(content_key) if self.cache else None
+            if cached is not None:
+                logger.info(f"  Using cached LinkedIn post response for {base_name}")
+                results[base_name] = cached
+                continue
+
+            # Global batch deployments select the model from the request body
+            body = dict(self.build_post_payload(key_takeaways), model=self.deployment_name)
+            batch_lines.append(json.dumps({
+                "custom_id": base_name,
+                "method": "POST",
+                "url": "/chat/completions",
+                "body": body
+            }))
+
+        if batch_lines:
+            logger.info(f"Submitting {len(batch_lines)} LinkedIn post request(s) as one batch job")
+            batch_results = self.run_batch_job(("\n".join(batch_lines) + "\n").encode('utf-8'))
+            for base_name, linkedin_post in batch_results.items():
+                self.cache_post(cache_keys[base_name], linkedin_post)
+            results.update(batch_results)
+
+        for base_name, original in duplicates.items():
+            if original in results:
+                results[base_name] = results[original]
+
+        # Save the posts and report progress in group order
+        for base_name, file_list in unprocessed_groups.items():
+            num_parts = len(file_list)
+            display_name = f"{base_name} ({num_parts} part{'s' if num_parts > 1 else ''})"
+            progress_tracker.start_item(display_name)
+
+            success = base_name in results
+            if success:
+                try:
+                    self.save_linkedin_post(base_name, results[base_name], prepared[base_name])
+                except Exception as e:
+                    logger.error(f"Failed to process {base_name}: {e}")
+                    success = False
+
+            progress_tracker.complete_item(display_name, success=success)
+
     def process_all_files(self):
         """Process all unprocessed file groups with progress tracking"""
         try:
@@ -718,26 +1475,10 @@ categories: {categories_list}
             )
             progress_tracker.start()
 
-            # Process each file group
-            for base_name, file_list in unprocessed_groups.items():
-                try:
-                    # Create display name showing number of parts
-                    num_parts = len(file_list)
-                    display_name = f"{base_name} ({num_parts} part{'s' if num_parts > 1 else ''})"
-                    progress_tracker.start_item(display_name)
-
-                    success = self.process_file_group(base_name, file_list)
-
-                    progress_tracker.complete_item(display_name, success=success)
-                except Exception as e:
-                    display_name = f"{base_name} ({len(file_list)} parts)"
-                    progress_tracker.complete_item(display_name, success=False)
-
-                    if "API quota exceeded" in str(e):
-                        logger.error("API quota exceeded. Stopping all processing.")
-                        break
-                    logger.error(f"Failed to process {base_name}: {e}")
-                    continue
+            if self.batch:
+                self.process_groups_in_batch(unprocessed_groups, progress_tracker)
+            else:
+                self.process_groups_concurrently(unprocessed_groups, progress_tracker)
 
             # Show final summary
             progress_tracker.finish()
@@ -755,6 +1496,58 @@ categories: {categories_list}
             logger.error(f"Error in process_all_files: {e}")
             raise
 
+    def process_groups_concurrently(self, unprocessed_groups, progress_tracker):
+        """
+        Generate the LinkedIn posts of all file groups with concurrent live API requests
+
+        Args:
+            unprocessed_groups: Dictionary of unprocessed file groups
+            progress_tracker: Progress tracker for the run
+        """
+        groups = list(unprocessed_groups.items())
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # File groups are independent, so their API calls are issued in parallel;
+            # with packing enabled each request covers pack_size groups
+            if self.pack_size > 1:
+                pending = [
+                    (groups[i:i + self.pack_size], executor.submit(self.process_file_groups_packed, groups[i:i + self.pack_size]))
+                    for i in range(0, len(groups), self.pack_size)
+                ]
+            else:
+                pending = [
+                    ([(base_name, file_list)], executor.submit(self.process_file_group, base_name, file_list))
+                    for base_name, file_list in groups
+                ]
+
+            # Collect results in group order for progress reporting
+            for chunk, future in pending:
+                try:
+                    result = future.result()
+                    error = None
+                except Exception as e:
+                    result = None
+                    error = e
+
+                for base_name, file_list in chunk:
+                    # Create display name showing number of parts
+                    num_parts = len(file_list)
+                    display_name = f"{base_name} ({num_parts} part{'s' if num_parts > 1 else ''})"
+                    progress_tracker.start_item(display_name)
+
+                    if error is None:
+                        success = result[base_name] if isinstance(result, dict) else result
+                        progress_tracker.complete_item(display_name, success=success)
+                    else:
+                        progress_tracker.complete_item(display_name, success=False)
+
+                if error is not None:
+                    if "API quota exceeded" in str(error):
+                        logger.error("API quota exceeded. Stopping all processing.")
+                        executor.shutdown(cancel_futures=True)
+                        break
+                    logger.error(f"Failed to process {', '.join(base_name for base_name, _ in chunk)}: {error}")
+
 
 def parse_arguments():
     """Parse command line arguments"""
@@ -774,6 +1567,24 @@ def parse_arguments():
         dest='output_folder',
         help='Output folder for LinkedIn posts (default: auto-generated with "-post" suffix)'
     )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Generate posts with one Azure OpenAI Batch job (about half the cost, up to 24h turnaround)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        dest='use_cache',
+        action='store_false',
+        help='Always call the API instead of reusing responses cached for identical requests (7 days)'
+    )
+    parser.add_argument(
+        '--pack',
+        dest='pack_size',
+        type=int,
+        default=1,
+        help='Generate up to N posts per live API request; helps when the deployment is RPM-bound (default: 1)'
+    )
     return parser.parse_args()
 
 
@@ -786,7 +1597,10 @@ def main():
         # Create generator with provided arguments
         generator = LinkedInPostGenerator(
             input_folder=args.input_folder,
-            output_folder=args.output_folder
+            output_folder=args.output_folder,
+            batch=args.batch,
+            use_cache=args.use_cache,
+            pack_size=args.pack_size
         )
 
         generator.process_all_files()
@@ -12,6 +12,7 @@ Automatic file selection:
 
 Usage:
     python step06_push_to_github.py -i /path/to/folder-post
+    python step06_push_to_github.py -i /path/to/folder-post --single-commit   # one commit for all files
 
 Example:
     python step06_push_to_github.py -i /Users/kiran.ramanna/Documents/github/mcp-moat/wisdomhatch-post
@@ -27,10 +28,14 @@ Example:
 
 import os
 import re
+import time
+import base64
 import argparse
 import datetime
+import requests
 from pathlib import Path
-from github import Github
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from github import Github, GithubException, RateLimitExceededException, UnknownObjectException
 from dotenv import load_dotenv
 from progress_utils import ProgressTracker, setup_logging
 
@@ -40,11 +45,48 @@ load_dotenv()
 # Configure logging
 logger = setup_logging(__name__)
 
+# Transient write failures: gateway errors, and ref conflicts from commits racing on the branch
+# (secondary rate limits arrive as RateLimitExceededException)
+_RETRY_STATUSES = (409, 502)
+
+# Requests left in the rate limit window below which publishing waits for the reset;
+# leaves room for the requests the concurrent pushes already have in flight
+_QUOTA_FLOOR = 20
+
+# Most entries the contents API returns for one directory
+_MAX_DIRECTORY_LISTING = 1000
+
+# Precompiled patterns used for every post
+_PURE_RE = re.compile(r'\n---\s*\n+##\s*Original Key Takeaways:')
+_TAKEAWAYS_HEADING = 'Original Key Takeaways:'
+_TITLE_RE = re.compile(r'title:\s*["\']?(.*?)["\']?\s*$', re.MULTILINE)
+_DATE_RE = re.compile(r'date:\s*(\d{4}-\d{2}-\d{2})', re.MULTILINE)
+# Matched against the raw bytes of files already on GitHub, which are never decoded as a whole
+_DATE_LINE_RE = re.compile(rb'date:\s*(.+?)$', re.MULTILINE)
+_DATE_SUB_RE = re.compile(r'(date:\s*)(.+?)$', re.MULTILINE)
+_SLUG_NONWORD_RE = re.compile(r'[^\w\s-]')
+_SLUG_DASH_RE = re.compile(r'[-\s]+')
+
+# GraphQL documents for publishing all files in one commit (--single-commit)
+_GRAPHQL_URL = "https://api.github.com/graphql"
+_HEAD_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef { name target { oid } }
+  }
+}
+"""
+_COMMIT_MUTATION = """
+mutation($input: CreateCommitOnBranchInput!) {
+  createCommitOnBranch(input: $input) { commit { oid } }
+}
+"""
+
 
 class GitHubPublisher:
     """A class to publish blog posts to GitHub"""
 
-    def __init__(self, input_folder=None, repo_name="kiranramanna/thinkit", remote_dir="_posts"):
+    def __init__(self, input_folder=None, repo_name="kiranramanna/thinkit", remote_dir="_posts", single_commit=False):
         """
         Initialize the GitHub publisher
 
@@ -52,6 +94,7 @@ class GitHubPublisher:
             input_folder: Directory containing blog post files (typically ending with -post)
             repo_name: GitHub repository name (format: username/repo)
             remote_dir: Directory in the repo where files should be created
+            single_commit: Publish all files in one GraphQL commit instead of one commit per file
         """
         if input_folder is None:
             raise ValueError("Input folder must be specified with -i argument")
@@ -59,10 +102,13 @@ class GitHubPublisher:
         self.input_folder = input_folder
         self.repo_name = repo_name
         self.remote_dir = remote_dir
+        self.single_commit = single_commit
 
         logger.info(f"Input folder: {self.input_folder}")
         logger.info(f"GitHub repository: {repo_name}")
         logger.info(f"Remote directory: {remote_dir}")
+        if single_commit:
+            logger.info("Single commit mode: all files are published in one commit")
 
         # Get GitHub token from environment
         self.github_token = os.getenv("GITHUB_TOKEN_THINKIT")
@@ -76,9 +122,17 @@ class GitHubPublisher:
                 "To create a token: https://github.com/settings/tokens"
             )
 
+        # {remote path: blob sha} for files already under remote_dir, loaded once per run
+        self.tree_index = None
+
+        # Pushes are independent and network-bound, so several run at once (3/4 of the CPUs, at most 8)
+        self.max_workers = min(8, max(1, (os.cpu_count() or 4) * 3 // 4))
+        self.max_retries = 5        # Retries of a write that failed transiently
+        self.retry_base_delay = 2   # Seconds, doubled on every retry
+
         # Initialize GitHub connection
         try:
-            self.github = Github(self.github_token)
+            self.github = Github(self.github_token, pool_size=self.max_workers)
             self.repo = self.github.get_repo(self.repo_name)
             logger.info("GitHub connection established")
         except Exception as e:
@@ -94,21 +148,22 @@ class GitHubPublisher:
         Returns:
             Pure content (frontmatter + blog post only)
         """
-        # Find the separator before "## Original Key Takeaways:"
-        # Split on the pattern: --- followed by ## Original Key Takeaways:
-        pattern = r'\n---\s*\n+##\s*Original Key Takeaways:'
-
-        parts = re.split(pattern, content, maxsplit=1)
-
-        if len(parts) > 1:
-            # Found the separator, return only the first part
-            pure_content = parts[0].strip()
-            logger.debug("  Extracted pure content (excluded Original Key Takeaways)")
-            return pure_content
-        else:
-            # No separator found, return full content
-            logger.debug("  No Original Key Takeaways section found, using full content")
-            return content.strip()
+        # Find the separator before "## Original Key Takeaways:": --- followed by
+        # ## Original Key Takeaways:. Only whitespace and ## can sit between the two, so a
+        # separator can only start at the last "\n---" before a heading, and the pattern is
+        # tried just there instead of scanning the whole post
+        heading = content.find(_TAKEAWAYS_HEADING)
+        while heading != -1:
+            idx = content.rfind('\n---', 0, heading)
+            if idx != -1 and _PURE_RE.match(content, idx):
+                # Found the separator, return only the part before it
+                logger.debug("  Extracted pure content (excluded Original Key Takeaways)")
+                return content[:idx].strip()
+            heading = content.find(_TAKEAWAYS_HEADING, heading + 1)
+
+        # No separator found, return full content
+        logger.debug("  No Original Key Takeaways section found, using full content")
+        return content.strip()
 
     def extract_frontmatter_title(self, content):
         """
@@ -120,7 +175,7 @@ class GitHubPublisher:
         Returns:
             Title string or None
         """
-        match = re.search(r'title:\s*["\']?(.*?)["\']?\s*$', content, re.MULTILINE)
+        match = _TITLE_RE.search(content)
         if match:
             return match.group(1).strip('"\'')
         return None
@@ -135,7 +190,7 @@ class GitHubPublisher:
         Returns:
             Date string (YYYY-MM-DD) or today's date
         """
-        match = re.search(r'date:\s*(\d{4}-\d{2}-\d{2})', content, re.MULTILINE)
+        match = _DATE_RE.search(content)
         if match:
             return match.group(1)
         return datetime.datetime.now().strftime('%Y-%m-%d')
@@ -161,8 +216,8 @@ class GitHubPublisher:
 
         # Convert title to slug: lowercase, replace spaces with hyphens, remove special chars
         slug = title.lower()
-        slug = re.sub(r'[^\w\s-]', '', slug)
-        slug = re.sub(r'[-\s]+', '-', slug)
+        slug = _SLUG_NONWORD_RE.sub('', slug)
+        slug = _SLUG_DASH_RE.sub('-', slug)
         slug = slug.strip('-')
 
         return f"{date_str}-{slug}.md"
@@ -171,19 +226,102 @@ class GitHubPublisher:
         """
         Get set of existing filenames on GitHub
 
+        The names come from the listing loaded once per run, so no extra request is made.
+
         Returns:
             Set of filenames
         """
+        if self.tree_index is None:
+            self.tree_index = self.load_tree_index()
+
+        prefix = f"{self.remote_dir}/"
         existing_files = set()
+        for path in self.tree_index or ():
+            name = path[len(prefix):]
+            if name.endswith('.md') and '/' not in name:
+                existing_files.add(name)
+        return existing_files
+
+    def load_tree_index(self):
+        """
+        Map every file under remote_dir on the default branch to its blob sha
+
+        One recursive tree listing replaces a get_contents() round-trip per file.
+
+        Returns:
+            Dict of {remote path: blob sha}, or None if the tree could not be listed
+        """
+        prefix = f"{self.remote_dir}/"
+        try:
+            self.await_quota()
+            tree = self.repo.get_git_tree(self.repo.default_branch, recursive=True)
+        except Exception as e:
+            logger.warning(f"Could not fetch repository tree from GitHub: {e}")
+            return self.load_directory_index()
+
+        if tree.raw_data.get('truncated'):
+            # GitHub cuts very large trees short, so a missing path would not prove anything
+            logger.warning("Repository tree listing is truncated, listing the remote directory instead")
+            return self.load_directory_index()
+
+        tree_index = {
+            entry.path: entry.sha
+            for entry in tree.tree
+            if entry.type == 'blob' and entry.path.startswith(prefix)
+        }
+        logger.info(f"Found {len(tree_index)} existing files in {self.remote_dir} on GitHub")
+        return tree_index
+
+    def load_directory_index(self):
+        """
+        Map the files directly inside remote_dir to their blob shas with one directory listing
+
+        Returns:
+            Dict of {remote path: blob sha}, or None if the directory could not be listed completely
+        """
         try:
             contents = self.repo.get_contents(self.remote_dir)
-            for content in contents:
-                if content.name.endswith('.md'):
-                    existing_files.add(content.name)
-            logger.info(f"Found {len(existing_files)} existing files on GitHub")
+        except UnknownObjectException:
+            # remote_dir does not exist yet, so every post is new
+            return {}
         except Exception as e:
             logger.warning(f"Could not fetch existing files from GitHub: {e}")
-        return existing_files
+            return None
+
+        if len(contents) >= _MAX_DIRECTORY_LISTING:
+            # The contents API stops listing a directory at this many entries
+            logger.warning("Remote directory listing is incomplete, checking files one by one")
+            return None
+
+        directory_index = {content.path: content.sha for content in contents if content.type == 'file'}
+        logger.info(f"Found {len(directory_index)} existing files in {self.remote_dir} on GitHub")
+        return directory_index
+
+    def get_existing_file(self, remote_path):
+        """
+        Fetch the current content and blob sha of a file on GitHub
+
+        Args:
+            remote_path: Path of the file in the repository
+
+        Returns:
+            Tuple of (content bytes, sha), or None if the file does not exist
+        """
+        if self.tree_index is None:
+            # No listing available, ask for the single file instead
+            self.await_quota()
+            try:
+                existing_file = self.repo.get_contents(remote_path)
+            except UnknownObjectException:
+                return None
+            return existing_file.decoded_content, existing_file.sha
+
+        sha = self.tree_index.get(remote_path)
+        if sha is None:
+            return None
+        self.await_quota()
+        blob = self.repo.get_git_blob(sha)
+        return base64.b64decode(blob.content), sha
 
     def get_files_to_process(self):
         """
@@ -227,17 +365,7 @@ class GitHubPublisher:
             file_path = os.path.join(self.input_folder, filename)
 
             try:
-                # Read file to determine GitHub filename
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                github_filename = self.generate_github_filename(filename, content)
-
-                all_files.append({
-                    'path': file_path,
-                    'filename': filename,
-                    'github_filename': github_filename
-                })
+                all_files.append(self.read_post(file_path, filename))
             except Exception as e:
                 logger.warning(f"Error reading file {filename}: {e}")
                 continue
@@ -251,90 +379,342 @@ class GitHubPublisher:
 
         Args:
             new_content: New content with potentially updated date
-            existing_content: Existing content from GitHub with original date
+            existing_content: Existing content from GitHub with original date, as bytes
 
         Returns:
             Content with original date preserved
         """
-        # Extract date from existing content
-        existing_date_match = re.search(r'date:\s*(.+?)$', existing_content, re.MULTILINE)
+        # Extract date from existing content; only the matched date is decoded
+        existing_date_match = _DATE_LINE_RE.search(existing_content)
 
         if existing_date_match:
-            existing_date = existing_date_match.group(1).strip()
-            # Replace date in new content with existing date
-            new_content = re.sub(
-                r'(date:\s*)(.+?)$',
-                r'\g<1>' + existing_date,
-                new_content,
-                count=1,
-                flags=re.MULTILINE
-            )
+            existing_date = existing_date_match.group(1).decode('utf-8', 'replace').strip()
+            # Replace date in new content with existing date; a function replacement
+            # inserts the date literally instead of parsing it as a template
+            new_content = _DATE_SUB_RE.sub(lambda match: match.group(1) + existing_date, new_content, count=1)
             logger.info(f"  Preserved original date: {existing_date}")
 
         return new_content
 
-    def push_file_to_github(self, file_path, filename, github_filename=None):
+    def call_with_backoff(self, func, *args):
         """
-        Push a single file to GitHub
+        Call a GitHub write method, retrying transient failures with exponential backoff
+
+        Args:
+            func: Repository method to call (e.g. self.repo.create_file)
+            *args: Arguments passed to func
+
+        Returns:
+            Whatever func returns
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return func(*args)
+            except GithubException as e:
+                retryable = isinstance(e, RateLimitExceededException) or e.status in _RETRY_STATUSES
+                if not retryable or attempt == self.max_retries:
+                    raise
+
+                # Honor GitHub's own wait hint when it sends one
+                retry_after = (e.headers or {}).get('retry-after')
+                delay = float(retry_after) if retry_after else self.retry_base_delay * 2 ** attempt
+                logger.warning(f"  GitHub returned {e.status}, retrying in {delay:.0f}s")
+                time.sleep(delay)
+
+    def read_post(self, file_path, filename):
+        """
+        Read a post and derive everything needed to publish it
 
         Args:
             file_path: Path to the local file
             filename: Original filename
-            github_filename: Target filename on GitHub
 
         Returns:
-            bool: True if successful, False otherwise
+            File info dictionary with path, filename, pure_content, title and github_filename
         """
-        try:
-            logger.info(f"  Reading file: {filename}")
+        logger.info(f"  Reading file: {filename}")
 
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                full_content = f.read()
+        # Read file content
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
 
-            # Extract pure content (without Original Key Takeaways)
-            pure_content = self.extract_pure_content(full_content)
+        # Extract pure content (without Original Key Takeaways); the filename and title
+        # come from the same text that is published, so both always agree
+        pure_content = self.extract_pure_content(content)
 
-            # Generate GitHub filename if not provided
-            if github_filename is None:
-                github_filename = self.generate_github_filename(filename, pure_content)
+        return {
+            'path': file_path,
+            'filename': filename,
+            'pure_content': pure_content,
+            'title': self.extract_frontmatter_title(pure_content) or filename,
+            'github_filename': self.generate_github_filename(filename, pure_content)
+        }
 
-            # Extract title for commit message
-            title = self.extract_frontmatter_title(pure_content) or filename
+    def prepare_file(self, file_info):
+        """
+        Work out what to publish on GitHub for a post
 
-            # Create remote path
-            remote_path = f"{self.remote_dir}/{github_filename}"
-            commit_message = f"Add post: {title}"
+        Args:
+            file_info: File info dictionary from read_post
 
-            logger.info(f"  Pushing to GitHub as: {github_filename}")
+        Returns:
+            Tuple of (remote_path, content, existing_sha); existing_sha is None for new files
+        """
+        # Create remote path
+        remote_path = f"{self.remote_dir}/{file_info['github_filename']}"
+        pure_content = file_info['pure_content']
 
-            try:
-                # Try to get existing file
-                existing_file = self.repo.get_contents(remote_path)
-                existing_content = existing_file.decoded_content.decode('utf-8')
+        existing = self.get_existing_file(remote_path)
+        if not existing:
+            return remote_path, pure_content, None
+
+        existing_content, existing_sha = existing
+
+        # Preserve the original date from existing file
+        pure_content = self.preserve_existing_date(pure_content, existing_content)
+        return remote_path, pure_content, existing_sha
+
+    def wait_for_reset(self, reset_time):
+        """
+        Sleep until a rate limit window resets
+
+        Args:
+            reset_time: Unix time at which the window resets
+        """
+        wait = reset_time - time.time() + 1
+        if wait > 0:
+            logger.warning(f"  GitHub rate limit nearly used up, waiting {wait:.0f}s for the reset")
+            time.sleep(wait)
+
+    def await_quota(self):
+        """Wait for the REST rate limit to reset when fewer than _QUOTA_FLOOR requests remain"""
+        # PyGithub keeps these from the headers of the last response, so checking costs no request
+        remaining, _ = self.github.rate_limiting
+        if remaining < _QUOTA_FLOOR:
+            self.wait_for_reset(self.github.rate_limiting_resettime)
+
+    def push_file_to_github(self, file_info):
+        """
+        Push a single file to GitHub
 
-                # Preserve the original date from existing file
-                pure_content = self.preserve_existing_date(pure_content, existing_content)
+        Args:
+            file_info: File info dictionary from read_post
 
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        filename = file_info['filename']
+        title = file_info['title']
+        try:
+            self.await_quota()
+            remote_path, pure_content, existing_sha = self.prepare_file(file_info)
+
+            logger.info(f"  Pushing to GitHub as: {remote_path}")
+
+            if existing_sha:
                 # Update the file
-                self.repo.update_file(
+                result = self.call_with_backoff(
+                    self.repo.update_file,
                     remote_path,
                     f"Update post: {title}",
                     pure_content,
-                    existing_file.sha
+                    existing_sha
                 )
                 logger.info(f"  ✓ File updated: {remote_path}")
-                return True
-            except:
+            else:
                 # If file doesn't exist, create it
-                self.repo.create_file(remote_path, commit_message, pure_content)
+                result = self.call_with_backoff(self.repo.create_file, remote_path, f"Add post: {title}", pure_content)
                 logger.info(f"  ✓ File created: {remote_path}")
-                return True
+
+            # A later post with the same GitHub filename must update this file, not create it again
+            if self.tree_index is not None:
+                self.tree_index[remote_path] = result['content'].sha
+            return True
 
         except Exception as e:
             logger.error(f"  ✗ Error pushing file {filename}: {e}")
             return False
 
+    def graphql(self, query, variables):
+        """
+        Run a query or mutation against GitHub's GraphQL API
+
+        Args:
+            query: GraphQL document
+            variables: Dictionary of GraphQL variables
+
+        Returns:
+            The response's data object
+        """
+        response = requests.post(
+            _GRAPHQL_URL,
+            json={'query': query, 'variables': variables},
+            headers={'Authorization': f"Bearer {self.github_token}"},
+            timeout=60
+        )
+        response.raise_for_status()
+        result = response.json()
+        if result.get('errors'):
+            raise Exception(f"GraphQL error: {result['errors'][0].get('message')}")
+
+        # GraphQL has its own quota, reported only in the response headers
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is not None and int(remaining) < _QUOTA_FLOOR:
+            self.wait_for_reset(int(response.headers.get('X-RateLimit-Reset', 0)))
+        return result['data']
+
+    def commit_files(self, additions, message):
+        """
+        Commit several files to the default branch as one commit
+
+        Args:
+            additions: List of {'path': remote path, 'contents': base64 content} dictionaries
+            message: Commit message
+
+        Returns:
+            The new commit's oid
+        """
+        owner, name = self.repo_name.split('/', 1)
+        branch = self.graphql(_HEAD_QUERY, {'owner': owner, 'name': name})['repository']['defaultBranchRef']
+
+        # expectedHeadOid makes GitHub reject the commit if the branch moved in the meantime
+        data = self.graphql(_COMMIT_MUTATION, {'input': {
+            'branch': {'repositoryNameWithOwner': self.repo_name, 'branchName': branch['name']},
+            'expectedHeadOid': branch['target']['oid'],
+            'message': {'headline': message},
+            'fileChanges': {'additions': additions}
+        }})
+        return data['createCommitOnBranch']['commit']['oid']
+
+    def publish_in_single_commit(self, files_to_process, progress_tracker):
+        """
+        Publish all files in one commit instead of one commit per file
+
+        Args:
+            files_to_process: List of file info dictionaries
+            progress_tracker: Progress tracker for the run
+
+        Returns:
+            Tuple of (successful, failed) file counts
+        """
+        prepared = []
+        failed = 0
+
+        # Fetching the dates of existing files is still per file, so it runs concurrently
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.prepare_file, file_info): (index, file_info)
+                for index, file_info in enumerate(files_to_process)
+            }
+
+            for future in as_completed(futures):
+                index, file_info = futures[future]
+                filename = file_info['filename']
+                try:
+                    prepared.append((index, filename, future.result()))
+                except Exception as e:
+                    logger.error(f"  ✗ Error preparing file {filename}: {e}")
+                    failed += 1
+                    progress_tracker.start_item(filename)
+                    progress_tracker.complete_item(filename, success=False)
+
+        if not prepared:
+            return 0, failed
+
+        # A commit can add each path only once; for posts with the same GitHub filename
+        # the last one wins, as it would when pushing them one by one
+        prepared.sort()
+        contents_by_path = {}
+        for _, _, (remote_path, content, _) in prepared:
+            if remote_path in contents_by_path:
+                logger.warning(f"  Several posts map to {remote_path}; the last one wins")
+            contents_by_path[remote_path] = content
+
+        additions = [
+            {'path': remote_path, 'contents': base64.b64encode(content.encode('utf-8')).decode('ascii')}
+            for remote_path, content in contents_by_path.items()
+        ]
+
+        try:
+            commit_oid = self.commit_files(additions, f"Publish {len(additions)} post(s)")
+            logger.info(f"  ✓ Committed {len(additions)} file(s) as {commit_oid[:7]}")
+            success = True
+        except Exception as e:
+            logger.error(f"  ✗ Error committing files: {e}")
+            success = False
+
+        for _, filename, _ in prepared:
+            progress_tracker.start_item(filename)
+            progress_tracker.complete_item(filename, success=success)
+
+        if success:
+            return len(prepared), failed
+        return 0, failed + len(prepared)
+
+    def push_files_concurrently(self, files_to_process, progress_tracker):
+        """
+        Push each file as its own commit, several files at a time
+
+        Args:
+            files_to_process: List of file info dictionaries
+            progress_tracker: Progress tracker for the run
+
+        Returns:
+            Tuple of (successful, failed) file counts
+        """
+        # Progress is reported from this thread as pushes finish
+        successful = 0
+        failed = 0
+
+        # Posts with the same GitHub filename go to one worker and are pushed in order;
+        # pushed concurrently, both would try to create the file and one would fail
+        files_by_path = {}
+        for file_info in files_to_process:
+            files_by_path.setdefault(file_info['github_filename'], []).append(file_info)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.push_files_in_order, file_infos): file_infos
+                for file_infos in files_by_path.values()
+            }
+
+            for future in as_completed(futures):
+                file_infos = futures[future]
+
+                try:
+                    results = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to process {file_infos[0]['github_filename']}: {e}")
+                    results = [False] * len(file_infos)
+
+                for file_info, success in zip(file_infos, results):
+                    filename = file_info['filename']
+                    progress_tracker.start_item(filename)
+
+                    if success:
+                        successful += 1
+                    else:
+                        failed += 1
+
+                    progress_tracker.complete_item(filename, success=success)
+
+        return successful, failed
+
+    def push_files_in_order(self, file_infos):
+        """
+        Push files that share a GitHub filename one after another
+
+        Args:
+            file_infos: List of file info dictionaries with the same github_filename
+
+        Returns:
+            List of per-file push results, in the same order
+        """
+        if len(file_infos) > 1:
+            logger.warning(f"  {len(file_infos)} posts map to {file_infos[0]['github_filename']}; "
+                           f"the last one pushed wins")
+        return [self.push_file_to_github(file_info) for file_info in file_infos]
+
     def process_all_files(self):
         """Process all files with progress tracking"""
         try:
@@ -345,6 +725,13 @@ class GitHubPublisher:
                 logger.info("No new files to process")
                 return
 
+            # List the files already on GitHub once instead of probing each path
+            self.tree_index = self.load_tree_index()
+            if self.tree_index is not None:
+                existing_files = self.get_existing_files_on_github()
+                updates = sum(1 for file_info in files_to_process if file_info['github_filename'] in existing_files)
+                logger.info(f"{updates} of {len(files_to_process)} file(s) already exist on GitHub and will be updated")
+
             # Initialize progress tracker
             progress_tracker = ProgressTracker(
                 total_items=len(files_to_process),
@@ -352,32 +739,10 @@ class GitHubPublisher:
             )
             progress_tracker.start()
 
-            # Process each file
-            successful = 0
-            failed = 0
-
-            for file_info in files_to_process:
-                try:
-                    file_path = file_info['path']
-                    filename = file_info['filename']
-                    github_filename = file_info.get('github_filename')
-
-                    progress_tracker.start_item(filename)
-
-                    success = self.push_file_to_github(file_path, filename, github_filename)
-
-                    if success:
-                        successful += 1
-                    else:
-                        failed += 1
-
-                    progress_tracker.complete_item(filename, success=success)
-
-                except Exception as e:
-                    logger.error(f"Failed to process {file_info['filename']}: {e}")
-                    failed += 1
-                    progress_tracker.complete_item(file_info['filename'], success=False)
-                    continue
+            if self.single_commit:
+                successful, failed = self.publish_in_single_commit(files_to_process, progress_tracker)
+            else:
+                successful, failed = self.push_files_concurrently(files_to_process, progress_tracker)
 
             # Show final summary
             progress_tracker.finish()
@@ -416,6 +781,11 @@ def parse_arguments():
         default='_posts',
         help='Remote directory in the repository (default: _posts)'
     )
+    parser.add_argument(
+        '--single-commit',
+        action='store_true',
+        help='Publish all files in one commit through the GraphQL API instead of one commit per file'
+    )
     return parser.parse_args()
 
 
@@ -429,7 +799,8 @@ def main():
         publisher = GitHubPublisher(
             input_folder=args.input_folder,
             repo_name=args.repo_name,
-            remote_dir=args.remote_dir
+            remote_dir=args.remote_dir,
+            single_commit=args.single_commit
         )
 
         publisher.process_all_files()
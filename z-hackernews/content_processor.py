@@ -1,48 +1,87 @@
 import os
+import re
 import time
 from datetime import datetime
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 
-def fetch_hn_top_stories():
-    """Fetch top stories from Hacker News API"""
+# Buffer size for the raw content file; 1 MB suits sequential I/O without oversizing
+RAW_BUFFER_SIZE = 1 << 20
+
+# Number of leading words kept as a story's summary, and the pattern that finds them
+SUMMARY_WORDS = 100
+_WORD_RE = re.compile(r'\S+')
+
+# One session for all Hacker News requests, so the story fetches reuse keep-alive
+# connections instead of a new TCP+TLS handshake each; transient server errors are retried,
+# and a 429 waits for as long as its Retry-After header asks instead of a fixed backoff
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+))
+_session.headers.update({'User-Agent': 'hn-fetcher/1.0'})
+
+def fetch_hn_story(story_id):
+    """Fetch a single story from Hacker News API"""
+    story_url = f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json'
+    story_response = _session.get(story_url)
+    return story_response.json()
+
+def fetch_hn_top_stories(etag=None):
+    """
+    Fetch top stories from Hacker News API
+
+    Returns a (stories, etag) tuple; stories is None when the top stories list
+    is unchanged since the given etag
+    """
     try:
+        # Ask Firebase to include the list's ETag, and send the previous one back so
+        # an unchanged list is answered with an empty 304 instead of the full list
+        headers = {'X-Firebase-ETag': 'true'}
+        if etag:
+            headers['If-None-Match'] = etag
+        
         # Fetch top story IDs
-        response = requests.get('https://hacker-news.firebaseio.com/v0/topstories.json')
+        response = _session.get('https://hacker-news.firebaseio.com/v0/topstories.json', headers=headers)
+        if response.status_code == 304:
+            return None, etag
         story_ids = response.json()[:10]  # Get top 10 stories
         
-        stories = []
-        for story_id in story_ids:
-            # Fetch individual story details
-            story_url = f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json'
-            story_response = requests.get(story_url)
-            story = story_response.json()
-            stories.append(story)
-            time.sleep(0.1)  # Be nice to the API
+        # Fetch individual story details concurrently; ten requests at once is
+        # well within what the Firebase API allows, so no pause between them
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            stories = list(executor.map(fetch_hn_story, story_ids))
         
-        return stories
+        return stories, response.headers.get('ETag')
     except Exception as e:
         print(f"Error fetching stories: {e}")
-        return []
+        return [], etag
 
 def save_raw_content(stories):
-    """Save raw content to a file"""
+    """Save raw content to a JSON Lines file, one story per line"""
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    filename = f'raw_content_{timestamp}.txt'
+    filename = f'raw_content_{timestamp}.jsonl'
     
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(stories, f, indent=2)
+    # The raw file is an archive for later tooling, so stories are written compactly
+    # (json then uses its C encoder) through a 1 MB buffer for sequential I/O
+    with open(filename, 'w', encoding='utf-8', buffering=RAW_BUFFER_SIZE) as f:
+        for story in stories:
+            f.write(json.dumps(story))
+            f.write('\n')
     
     return filename
 
-def process_content(raw_filename):
-    """Process content in chunks and save results"""
+def process_content(stories):
+    """Process fetched stories and save results"""
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     processed_filename = f'processed_content_{timestamp}.txt'
     
-    with open(raw_filename, 'r', encoding='utf-8') as f:
-        stories = json.load(f)
-    
     processed_content = []
     for story in stories:
         # Extract title and first 100 words of text if available
@@ -50,8 +89,9 @@ def process_content(raw_filename):
         text = story.get('text', '')
         url = story.get('url', '')
         
-        words = text.split()[:100]
-        summary = ' '.join(words)
+        # Scan only as far as the first words instead of splitting the whole text
+        words = islice(_WORD_RE.finditer(text), SUMMARY_WORDS)
+        summary = ' '.join(match.group(0) for match in words)
         
         processed_story = {
             'title': title,
@@ -61,22 +101,26 @@ def process_content(raw_filename):
         processed_content.append(processed_story)
     
     with open(processed_filename, 'w', encoding='utf-8') as f:
-        json.dump(processed_content, f, indent=2)
+        f.write(json.dumps(processed_content, indent=2))
     
     return processed_filename
 
 def main():
     """Main execution loop"""
     try:
+        etag = None
         while True:
             print("Fetching new stories...")
-            stories = fetch_hn_top_stories()
+            stories, etag = fetch_hn_top_stories(etag)
             
-            if stories:
+            if stories is None:
+                print("No change in top stories since the last fetch")
+            elif stories:
                 raw_filename = save_raw_content(stories)
                 print(f"Raw content saved to: {raw_filename}")
                 
-                processed_filename = process_content(raw_filename)
+                # Stories are processed from memory; the raw file is only an archive
+                processed_filename = process_content(stories)
                 print(f"Processed content saved to: {processed_filename}")
             
             print("Waiting for 5 minutes before next fetch...")
@@ -1,8 +1,9 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from datetime import datetime
 import logging
-import time
 from typing import List, Dict, Any
 
 # Configure logging
@@ -17,11 +18,17 @@ class HackerNewsFetcher:
     
     def __init__(self):
         self.base_url = "https://hacker-news.firebaseio.com/v0"
+        # The API has no fixed request rate to respect, so instead of pausing between
+        # requests the session backs off only when told to (429, honoring Retry-After)
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429])
+        ))
     
     def get_top_stories(self, limit: int = 10) -> List[int]:
         """Fetch IDs of top stories"""
         try:
-            response = requests.get(f"{self.base_url}/topstories.json")
+            response = self.session.get(f"{self.base_url}/topstories.json")
             response.raise_for_status()
             return response.json()[:limit]
         except Exception as e:
@@ -31,7 +38,7 @@ class HackerNewsFetcher:
     def get_story_details(self, story_id: int) -> Dict[str, Any]:
         """Fetch details of a specific story"""
         try:
-            response = requests.get(f"{self.base_url}/item/{story_id}.json")
+            response = self.session.get(f"{self.base_url}/item/{story_id}.json")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -44,11 +51,7 @@ class HackerNewsFetcher:
             logger.info(f"Fetching top {limit} Hacker News stories...")
             story_ids = self.get_top_stories(limit)
             
-            stories = []
-            for story_id in story_ids:
-                story = self.get_story_details(story_id)
-                stories.append(story)
-                time.sleep(0.1)  # Be nice to the API
+            stories = [self.get_story_details(story_id) for story_id in story_ids]
             
             # Create timestamp for filenames
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -3,6 +3,7 @@ from mcp.client.stdio import stdio_client
 import logging
 import os
 import json
+from contextlib import AsyncExitStack
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from enum import Enum
@@ -32,6 +33,8 @@ class MCPClient:
             server_type, server_command, server_args, server_env
         )
         self.session: Optional[ClientSession] = None
+        # Owns the stdio subprocess and the session, so close() exits both in reverse order
+        self._exit_stack: Optional[AsyncExitStack] = None
 
     def _get_server_params(
         self,
@@ -89,17 +92,22 @@ class MCPClient:
 
     async def initialize(self) -> None:
         """Initialize the MCP client session"""
+        self._exit_stack = AsyncExitStack()
         try:
-            read, write = await stdio_client(self.server_params).__aenter__()
-            self.session = await ClientSession(
+            read, write = await self._exit_stack.enter_async_context(stdio_client(self.server_params))
+            self.session = await self._exit_stack.enter_async_context(ClientSession(
                 read,
                 write,
                 sampling_callback=self.handle_sampling_message
-            ).__aenter__()
+            ))
             await self.session.initialize()
             logger.info(f"MCP client session initialized successfully for {self.server_type.value} server")
         except Exception as e:
             logger.error(f"Failed to initialize MCP client: {e}")
+            # Don't leave a half-started server process behind
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+            self.session = None
             raise
 
     async def list_available_resources(self) -> list:
@@ -152,13 +160,17 @@ class MCPClient:
 
     async def close(self) -> None:
         """Close the MCP client session"""
-        if self.session:
+        if self._exit_stack:
             try:
-                await self.session.__aexit__(None, None, None)
+                # Exits the session first, then stops the stdio server process
+                await self._exit_stack.aclose()
                 logger.info("MCP client session closed successfully")
             except Exception as e:
                 logger.error(f"Error closing session: {e}")
                 raise
+            finally:
+                self._exit_stack = None
+                self.session = None
 
 async def main():
     """Example usage of the MCP client with Hacker News"""
@@ -183,23 +195,26 @@ async def main():
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f'hackernews_posts_{timestamp}.txt'
         
-        # Format and save the posts
+        # Format the posts into one buffer and save them with a single write
+        parts = ["=== Latest Hacker News Posts ===\n\n"]
+        parts.extend(
+            f"{idx}. {story.get('title', 'No title')}\n"
+            f"   URL: {story.get('url', 'No URL')}\n"
+            f"   Score: {story.get('score', 0)}\n"
+            f"   Author: {story.get('by', 'Unknown')}\n"
+            f"   Comments: {story.get('descendants', 0)}\n"
+            "\n"
+            for idx, story in enumerate(result, 1)
+        )
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write("=== Latest Hacker News Posts ===\n\n")
-            for idx, story in enumerate(result, 1):
-                f.write(f"{idx}. {story.get('title', 'No title')}\n")
-                f.write(f"   URL: {story.get('url', 'No URL')}\n")
-                f.write(f"   Score: {story.get('score', 0)}\n")
-                f.write(f"   Author: {story.get('by', 'Unknown')}\n")
-                f.write(f"   Comments: {story.get('descendants', 0)}\n")
-                f.write("\n")
+            f.write(''.join(parts))
         
         logger.info(f"Saved Hacker News posts to {filename}")
         
         # Also save raw JSON for potential further processing
         json_filename = f'hackernews_posts_{timestamp}.json'
         with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2)
+            f.write(json.dumps(result, indent=2))
         
         logger.info(f"Saved raw JSON data to {json_filename}")
         